@@ -1,23 +1,114 @@
+import hashlib
 import logging
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+from flask.sessions import SessionInterface
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --- Basic Configuration ---
-load_dotenv() 
-logging.basicConfig(level=logging.INFO)
+# Deployed containers get their settings from the environment; .env is for local runs
+if os.environ.get("FLASK_ENV") != "production":
+    load_dotenv()
+# Request payloads are only logged at DEBUG; production runs at INFO or above
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").strip().upper()
+_log_level = logging.getLevelNamesMapping().get(LOG_LEVEL)
+logging.basicConfig(level=_log_level if _log_level is not None else logging.INFO)
 logger = logging.getLogger(__name__)
+if _log_level is None:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", LOG_LEVEL)
 
 # --- Flask Application Setup ---
 app = Flask(__name__, 
             template_folder='templates', 
             static_folder='static')
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify() and request.json."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype="application/json")
+
+
+app.json = OrjsonProvider(app)
+
+
+class StatelessSessionInterface(SessionInterface):
+    """The app keeps no session state, so skip cookie parsing and signing."""
+
+    def open_session(self, app, request):
+        return self.make_null_session(app)
+
+    def save_session(self, app, session, response):
+        pass
+
+
+app.session_interface = StatelessSessionInterface()
+
+
+def _static_assets_version():
+    """Short hash of the static files' contents: identical in every worker, changes whenever an asset does."""
+    digest = hashlib.blake2b(digest_size=6)
+    static_root = Path(app.static_folder)
+    for path in sorted(static_root.rglob('*')):
+        if path.is_file():
+            digest.update(path.relative_to(static_root).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+# Cache-busting ?v= suffix for static asset URLs in templates
+app.jinja_env.globals['asset_version'] = _static_assets_version()
+
+# Cap request bodies; clients only send small JSON payloads
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get("MAX_CONTENT_LENGTH", 256 * 1024))
+
+# Error bodies with constant content, encoded once
+INVALID_BODY_ERROR = orjson.dumps({"success": False, "error": "Invalid request body", "error_type": "value_error"})
+BODY_TOO_LARGE_ERROR = orjson.dumps({"success": False, "error": "Request body is too large", "error_type": "value_error"})
+MCP_CONNECTION_ERROR = orjson.dumps({"success": False, "error": "Could not connect to the AI service backend. Please ensure it's running.", "error_type": "connection_error"})
+MCP_TIMEOUT_ERROR = orjson.dumps({"success": False, "error": "The request to the AI service timed out.", "error_type": "timeout_error"})
+NO_DESCRIPTION = orjson.dumps({"description": "No description available."})
+
+def _json_bytes_response(body, status):
+    return Response(body, status=status, mimetype='application/json')
+
+
+@app.errorhandler(400)
+def handle_bad_request(e):
+    """Return malformed-request errors (e.g. invalid JSON) as JSON."""
+    return _json_bytes_response(INVALID_BODY_ERROR, 400)
+
+
+@app.errorhandler(413)
+def handle_payload_too_large(e):
+    """Return oversized-body errors as JSON."""
+    return _json_bytes_response(BODY_TOO_LARGE_ERROR, 413)
+
+# Read once at startup; changing these requires a restart
+MOCK_MCP = os.environ.get('MOCK_MCP', '0') == '1'
+# Raw env keys are only ever returned in debug/development mode
+SHOW_KEYS = app.debug or os.environ.get('FLASK_ENV') == 'development'
+
 # --- Attach mock MCP server if MOCK_MCP env is set ---
-if os.environ.get('MOCK_MCP', '0') == '1':
+if MOCK_MCP:
     # Import and register the mock MCP server blueprint
     from mock_mcp_server import mock_mcp
     app.register_blueprint(mock_mcp)
@@ -29,90 +120,163 @@ MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:10001")
 EXECUTE_ENDPOINT = f"{MCP_SERVER_URL}/mcp/v1/execute"
 PROVIDERS_ENDPOINT = f"{MCP_SERVER_URL}/mcp/v1/providers"
 MODELS_ENDPOINT = f"{MCP_SERVER_URL}/mcp/v1/models"
+MODEL_DESCRIPTION_ENDPOINT = f"{MCP_SERVER_URL}/mcp/v1/model-description"
+# Request bodies for the MCP server are encoded with orjson and sent as raw bytes
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# One keep-alive connection pool to the MCP server, shared by all proxy handlers.
+# Retry only covers idempotent requests (GET), so execute POSTs are never replayed.
+# 503 is not retried: the MCP server uses it for "no providers loaded", which a retry won't fix.
+_mcp_session = requests.Session()
+_mcp_session.mount(MCP_SERVER_URL, HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 504), raise_on_status=False),
+))
+
+# Providers/models only change when the MCP server restarts, so the assembled dict is cached briefly
+AVAILABLE_MODELS_TTL = float(os.getenv("AVAILABLE_MODELS_TTL", 60))
+_available_models_cache = {'models': None, 'expires_at': 0.0}
+_available_models_lock = threading.Lock()
+# Model descriptions are static per provider/model; cache them to skip the MCP round trip
+MODEL_DESCRIPTION_TTL = float(os.getenv("MODEL_DESCRIPTION_TTL", 3600))
+MODEL_DESCRIPTIONS_MAX = 256
+_model_descriptions = {}
+_model_descriptions_lock = threading.Lock()
+# Shared pool for fanning out per-provider model listing requests
+_listing_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mcp-listing')
 
 # --- Environment Variable API Key Handling ---
-ENV_API_KEYS = {
-    'openai': os.getenv("OPENAI_API_KEY"),
-    'anthropic': os.getenv("ANTHROPIC_API_KEY"),
-    'google': os.getenv("GOOGLE_API_KEY"),
+ENV_KEY_NAMES = {
+    'openai': "OPENAI_API_KEY",
+    'anthropic': "ANTHROPIC_API_KEY",
+    'google': "GOOGLE_API_KEY",
 }
+# Read once at startup; blank values count as missing
+ENV_API_KEYS = {provider: (os.getenv(var) or "").strip() or None for provider, var in ENV_KEY_NAMES.items()}
+
+_index_html = None
 
 @app.route('/')
 def index():
-    """Render the main page. Always fetch available models fresh on each reload."""
-    available_models = _get_available_models()  # Fetch models dynamically on each request
-    return render_template('index.html', availableModels=available_models)
+    """
+    Render the main page. Providers and models are loaded by the page itself
+    (main.js loadAgents), so the HTML does not depend on the MCP server. Asset
+    URLs carry the startup-computed asset_version, so outside debug mode the
+    page is rendered once per process and is the same in every worker.
+    """
+    global _index_html
+    if app.debug:
+        # Pick up template and asset edits while developing
+        return render_template('index.html', asset_version=_static_assets_version())
+    if _index_html is None:
+        _index_html = render_template('index.html')
+    return _index_html
 
 # Keys API
 
-@app.route('/get_env_key_status', methods=['POST'])
 def get_env_key_status():
     """Check if an API key exists in environment variables for the given provider."""
-
-    if os.environ.get('MOCK_MCP', '0') == '1':
-        # Return mock agents directly for UI development
-        return jsonify({'exists': True}), 200
-
     provider = request.json.get('provider')
     api_key_exists = bool(ENV_API_KEYS.get(provider))
-    logger.debug(f"Env key status check for '{provider}': {api_key_exists}")
+    logger.debug("Env key status check for '%s': %s", provider, api_key_exists)
     return jsonify({'exists': api_key_exists})
 
-@app.route('/api/check-env-key/<provider>', methods=['GET'])
 def api_check_env_key(provider):
     """Check if an API key exists in environment variables for the given provider. For dev: may return key itself."""
-
-    if os.environ.get('MOCK_MCP', '0') == '1':
-        # Return mock agents directly for UI development
-        return jsonify({'exists': True, 'api_key': '********'}), 200
-
     key = ENV_API_KEYS.get(provider)
     exists = bool(key)
     # Only return key in debug mode (never in production)
-    show_key = app.debug or os.environ.get('FLASK_ENV') == 'development'
-    return jsonify({'exists': exists, 'api_key': key if (show_key and key) else ('********' if exists else None)})
-
+    return jsonify({'exists': exists, 'api_key': key if (SHOW_KEYS and key) else ('********' if exists else None)})
+
+def _mock_env_key_status():
+    return jsonify({'exists': True}), 200
+
+def _mock_check_env_key(provider):
+    return jsonify({'exists': True, 'api_key': '********'}), 200
+
+# MOCK_MCP is fixed at startup, so pick the implementation once instead of branching per request.
+# The endpoint names stay the same either way.
+if MOCK_MCP:
+    # Report every key as present for UI development
+    app.add_url_rule('/get_env_key_status', 'get_env_key_status', _mock_env_key_status, methods=['POST'])
+    app.add_url_rule('/api/check-env-key/<provider>', 'api_check_env_key', _mock_check_env_key, methods=['GET'])
+else:
+    app.add_url_rule('/get_env_key_status', 'get_env_key_status', get_env_key_status, methods=['POST'])
+    app.add_url_rule('/api/check-env-key/<provider>', 'api_check_env_key', api_check_env_key, methods=['GET'])
+
+
+# MCP communication errors
+
+@app.errorhandler(requests.exceptions.ConnectionError)
+def handle_mcp_connection_error(e):
+    logger.error("Could not connect to MCP server at %s: %s", MCP_SERVER_URL, e)
+    return _json_bytes_response(MCP_CONNECTION_ERROR, 503)
+
+@app.errorhandler(requests.exceptions.Timeout)
+def handle_mcp_timeout(e):
+    logger.error("Request to MCP server timed out.")
+    return _json_bytes_response(MCP_TIMEOUT_ERROR, 504)
+
+@app.errorhandler(requests.exceptions.RequestException)
+def handle_mcp_request_error(e):
+    error_message = str(e)
+    logger.error("Error communicating with MCP server: %s", error_message)
+    # A requests.Response is falsy for 4xx/5xx, so test for presence explicitly
+    mcp_response = e.response
+    try:
+        error_detail = orjson.loads(mcp_response.content) if mcp_response is not None else error_message
+        status_code = mcp_response.status_code if mcp_response is not None else 500
+    except Exception:
+        error_detail = error_message
+        status_code = 500
+    if isinstance(error_detail, dict) and 'success' in error_detail:
+        return jsonify(error_detail), status_code
+    else:
+        return jsonify({"success": False, "error": f"An error occurred: {error_detail}", "error_type": "mcp_error"}), status_code
 
 # MCP Execute
 
-@app.route('/api/generate', methods=['POST'])
-def api_generate():
-    """API endpoint to generate content via MCP server."""
-    data = request.json
-    logger.info(f"Received /api/generate request: {data}")
+# Request fields copied into the MCP context when the client sends them at the top level
+CONTEXT_FIELDS = ('platform', 'technology', 'topic', 'tags', 'question')
+USER_QUIZ_CONTEXT_FIELDS = CONTEXT_FIELDS + ('style',)
 
-    # Prepare context for MCP request
-    context_data = data.get('context', {})
-    context_fields = ['platform', 'technology', 'topic', 'tags', 'question']
-    for field in context_fields:
+def _parse_tags(value):
+    """Turn a comma-separated string or a list into a list of non-empty, stripped tags."""
+    if isinstance(value, str):
+        return [t.strip() for t in value.split(',') if t.strip()]
+    if isinstance(value, list):
+        return [str(t).strip() for t in value if str(t).strip()]
+    return []
+
+def _build_context(data, fields):
+    """
+    Build the MCP context from a frontend request: start from data['context'],
+    fill empty fields from top-level values ('tech' is accepted for 'technology')
+    and normalize tags, falling back to 'keywords'.
+    """
+    context_data = dict(data.get('context') or {})
+    for field in fields:
         if field == 'technology':
             val = data.get('technology') or data.get('tech')
         else:
             val = data.get(field)
-        if val is not None and (field not in context_data or not context_data.get(field)):
+        if val is not None and not context_data.get(field):
             context_data[field] = val
-    # Handle tags/keywords normalization
-    if 'tags' not in context_data and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-    if 'tags' in context_data and isinstance(context_data['tags'], str):
-        context_data['tags'] = [t.strip() for t in context_data['tags'].split(',') if t.strip()]
-    if 'tags' not in context_data:
-        context_data['tags'] = []
-    if not context_data['tags'] and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-
-    # Prepare new MCP format request
+
+    tags = context_data.get('tags')
+    if isinstance(tags, str):
+        tags = _parse_tags(tags)
+    if not tags:
+        tags = _parse_tags(data.get('keywords'))
+    context_data['tags'] = tags
+    return context_data
+
+def _mcp_proxy(operation, data, fields=CONTEXT_FIELDS):
+    """Build the MCP execute request for operation from a frontend request body and relay the MCP response."""
     mcp_request = {
-        "operation": data.get("operation") or "generate",  # Default to 'generate' if not specified
-        "context": context_data,
+        "operation": operation,
+        "context": _build_context(data, fields),
         "ai": {
             "provider": data.get("provider") or data.get("ai") or data.get("resource_id"),
             "model": data.get("model"),
@@ -120,269 +284,65 @@ def api_generate():
         }
     }
 
-    logger.info(f"Sending request to MCP server: {mcp_request}")
-    # Send mcp_request to MCP server and return the result
-    try:
-        response = requests.post(EXECUTE_ENDPOINT, json=mcp_request, timeout=60)
-        response.raise_for_status()
-        mcp_response_data = response.json()
-        logger.info(f"Received response from MCP server: {mcp_response_data}")
-        return jsonify(mcp_response_data), response.status_code
-    except requests.exceptions.ConnectionError as e:
-        logger.error(f"Could not connect to MCP server at {MCP_SERVER_URL}: {e}")
-        return jsonify({"success": False, "error": f"Could not connect to the AI service backend. Please ensure it's running.", "error_type": "connection_error"}), 503
-    except requests.exceptions.Timeout:
-        logger.error(f"Request to MCP server timed out.")
-        return jsonify({"success": False, "error": "The request to the AI service timed out.", "error_type": "timeout_error"}), 504
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error communicating with MCP server: {e}")
-        try:
-            error_detail = e.response.json() if e.response else str(e)
-            status_code = e.response.status_code if e.response else 500
-        except Exception:
-            error_detail = str(e)
-            status_code = 500
-        if isinstance(error_detail, dict) and 'success' in error_detail:
-            return jsonify(error_detail), status_code
-        else:
-            return jsonify({"success": False, "error": f"An error occurred: {error_detail}", "error_type": "mcp_error"}), status_code
+    logger.info("Sending %s request to MCP server", operation)
+    # MCP communication errors are turned into JSON responses by the errorhandlers above
+    response = _mcp_session.post(EXECUTE_ENDPOINT, data=orjson.dumps(mcp_request), headers=JSON_HEADERS,
+                                 params=_execute_params(data), timeout=60)
+    response.raise_for_status()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received response from MCP server: %s", response.text)
+    return _relay_execute_response(response)
 
+@app.route('/api/generate', methods=['POST'])
+def api_generate():
+    """API endpoint to generate content via MCP server."""
+    data = request.json
+    logger.debug("Received /api/generate request: %s", data)
+    # Default to 'generate' if not specified
+    return _mcp_proxy(data.get("operation") or "generate", data)
 
 @app.route('/api/quiz', methods=['POST'])
 def api_quiz():
     """API endpoint to generate a quiz via MCP server."""
     data = request.json
-    logger.info(f"Received /api/quiz request: {data}")
-
-    # Prepare context for MCP request
-    context_data = data.get('context', {})  # Ensure context_data is defined
-    context_fields = ['platform', 'technology', 'topic', 'tags', 'question']
-    for field in context_fields:
-        if field == 'technology':
-            val = data.get('technology') or data.get('tech')
-        else:
-            val = data.get(field)
-        if val is not None and (field not in context_data or not context_data.get(field)):
-            context_data[field] = val
-    # Handle tags/keywords normalization
-    if 'tags' not in context_data and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-    if 'tags' in context_data and isinstance(context_data['tags'], str):
-        context_data['tags'] = [t.strip() for t in context_data['tags'].split(',') if t.strip()]
-    if 'tags' not in context_data:
-        context_data['tags'] = []
-    if not context_data['tags'] and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-
-    # Prepare new MCP format request for quiz
-    mcp_request = {
-        "operation": "quiz",
-        "context": context_data,
-        "ai": {
-            "provider": data.get("provider") or data.get("ai") or data.get("resource_id"),
-            "model": data.get("model"),
-            "api_key": data.get("apiKey")
-        }
-    }
-
-    logger.info(f"Sending request to MCP server: {EXECUTE_ENDPOINT} with payload: {mcp_request}")
-    try:
-        response = requests.post(EXECUTE_ENDPOINT, json=mcp_request, timeout=60)
-        response.raise_for_status()
-        mcp_response_data = response.json()
-        logger.info(f"Received response from MCP server: {mcp_response_data}")
-        return jsonify(mcp_response_data), response.status_code
-    except requests.exceptions.ConnectionError as e:
-        logger.error(f"Could not connect to MCP server at {MCP_SERVER_URL}: {e}")
-        return jsonify({"success": False, "error": f"Could not connect to the AI service backend. Please ensure it's running.", "error_type": "connection_error"}), 503
-    except requests.exceptions.Timeout:
-        logger.error(f"Request to MCP server timed out.")
-        return jsonify({"success": False, "error": "The request to the AI service timed out.", "error_type": "timeout_error"}), 504
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error communicating with MCP server: {e}")
-        try:
-            error_detail = e.response.json() if e.response else str(e)
-            status_code = e.response.status_code if e.response else 500
-        except Exception:
-            error_detail = str(e)
-            status_code = 500
-        if isinstance(error_detail, dict) and 'success' in error_detail:
-            return jsonify(error_detail), status_code
-        else:
-            return jsonify({"success": False, "error": f"An error occurred: {error_detail}", "error_type": "mcp_error"}), status_code
-
+    logger.debug("Received /api/quiz request: %s", data)
+    return _mcp_proxy("quiz", data)
 
 @app.route('/api/user-quiz', methods=['POST'])
 def api_user_quiz():
     """API endpoint to generate a user quiz via MCP server."""
     data = request.json
-    logger.info(f"Received /api/user-quiz request: {data}")
-
-    # Prepare context for MCP request
-    context_data = data.get('context', {})  # Ensure context_data is defined
-    context_fields = ['platform', 'technology', 'topic', 'tags', 'question', 'style']
-    for field in context_fields:
-        if field == 'technology':
-            val = data.get('technology') or data.get('tech')
-        else:
-            val = data.get(field)
-        if val is not None and (field not in context_data or not context_data.get(field)):
-            context_data[field] = val
-    # Handle tags/keywords normalization
-    if 'tags' not in context_data and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-    if 'tags' in context_data and isinstance(context_data['tags'], str):
-        context_data['tags'] = [t.strip() for t in context_data['tags'].split(',') if t.strip()]
-    if 'tags' not in context_data:
-        context_data['tags'] = []
-    if not context_data['tags'] and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-
-    # Prepare new MCP format request for user quiz
-    mcp_request = {
-        "operation": "user_quiz",
-        "context": context_data,
-        "ai": {
-            "provider": data.get("provider") or data.get("ai") or data.get("resource_id"),
-            "model": data.get("model"),
-            "api_key": data.get("apiKey")
-        }
-    }
-
-    logger.info(f"Sending request to MCP server: {EXECUTE_ENDPOINT} with payload: {mcp_request}")
-    try:
-        response = requests.post(EXECUTE_ENDPOINT, json=mcp_request, timeout=60)
-        response.raise_for_status()
-        mcp_response_data = response.json()
-        logger.info(f"Received response from MCP server: {mcp_response_data}")
-        return jsonify(mcp_response_data), response.status_code
-    except requests.exceptions.ConnectionError as e:
-        logger.error(f"Could not connect to MCP server at {MCP_SERVER_URL}: {e}")
-        return jsonify({"success": False, "error": f"Could not connect to the AI service backend. Please ensure it's running.", "error_type": "connection_error"}), 503
-    except requests.exceptions.Timeout:
-        logger.error(f"Request to MCP server timed out.")
-        return jsonify({"success": False, "error": "The request to the AI service timed out.", "error_type": "timeout_error"}), 504
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error communicating with MCP server: {e}")
-        try:
-            error_detail = e.response.json() if e.response else str(e)
-            status_code = e.response.status_code if e.response else 500
-        except Exception:
-            error_detail = str(e)
-            status_code = 500
-        if isinstance(error_detail, dict) and 'success' in error_detail:
-            return jsonify(error_detail), status_code
-        else:
-            return jsonify({"success": False, "error": f"An error occurred: {error_detail}", "error_type": "mcp_error"}), status_code
+    logger.debug("Received /api/user-quiz request: %s", data)
+    return _mcp_proxy("user_quiz", data, USER_QUIZ_CONTEXT_FIELDS)
 
 @app.route('/api/validate', methods=['POST'])
 def api_validate():
     """API endpoint to validate content via MCP server."""
     data = request.json
-    logger.info(f"Received /api/validate request: {data}")
-
-    # Prepare context for MCP request
-    context_data = data.get('context', {})
-    context_fields = ['platform', 'technology', 'topic', 'tags', 'question']
-    for field in context_fields:
-        if field == 'technology':
-            val = data.get('technology') or data.get('tech')
-        else:
-            val = data.get(field)
-        if val is not None and (field not in context_data or not context_data.get(field)):
-            context_data[field] = val
-    # Handle tags/keywords normalization
-    if 'tags' not in context_data and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-    if 'tags' in context_data and isinstance(context_data['tags'], str):
-        context_data['tags'] = [t.strip() for t in context_data['tags'].split(',') if t.strip()]
-    if 'tags' not in context_data:
-        context_data['tags'] = []
-    if not context_data['tags'] and 'keywords' in data:
-        keywords_val = data.get('keywords')
-        if isinstance(keywords_val, str):
-            context_data['tags'] = [t.strip() for t in keywords_val.split(',') if t.strip()]
-        elif isinstance(keywords_val, list):
-            context_data['tags'] = [str(t).strip() for t in keywords_val if str(t).strip()]
-
-    # Prepare new MCP format request for validate
-    mcp_request = {
-        "operation": "validate",
-        "context": context_data,
-        "ai": {
-            "provider": data.get("provider") or data.get("ai") or data.get("resource_id"),
-            "model": data.get("model"),
-            "api_key": data.get("apiKey")
-        }
-    }
-
-    logger.info(f"Sending request to MCP server: {EXECUTE_ENDPOINT} with payload: {mcp_request}")
-    try:
-        response = requests.post(EXECUTE_ENDPOINT, json=mcp_request, timeout=60)
-        response.raise_for_status()
-        mcp_response_data = response.json()
-        logger.info(f"Received response from MCP server: {mcp_response_data}")
-        return jsonify(mcp_response_data), response.status_code
-    except requests.exceptions.ConnectionError as e:
-        logger.error(f"Could not connect to MCP server at {MCP_SERVER_URL}: {e}")
-        return jsonify({"success": False, "error": f"Could not connect to the AI service backend. Please ensure it's running.", "error_type": "connection_error"}), 503
-    except requests.exceptions.Timeout:
-        logger.error(f"Request to MCP server timed out.")
-        return jsonify({"success": False, "error": "The request to the AI service timed out.", "error_type": "timeout_error"}), 504
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error communicating with MCP server: {e}")
-        try:
-            error_detail = e.response.json() if e.response else str(e)
-            status_code = e.response.status_code if e.response else 500
-        except Exception:
-            error_detail = str(e)
-            status_code = 500
-        if isinstance(error_detail, dict) and 'success' in error_detail:
-            return jsonify(error_detail), status_code
-        else:
-            return jsonify({"success": False, "error": f"An error occurred: {error_detail}", "error_type": "mcp_error"}), status_code
+    logger.debug("Received /api/validate request: %s", data)
+    return _mcp_proxy("validate", data)
 
 # MCP Info 
 @app.route('/api/providers', methods=['GET'])
 def get_providers():
     """Get list of available providers from MCP server."""
     try:
-        response = requests.get(PROVIDERS_ENDPOINT)
-        response.raise_for_status()
-        return jsonify(response.json()), response.status_code
+        # Relay MCP error statuses (e.g. 503) and their JSON bodies as-is
+        response = _mcp_session.get(PROVIDERS_ENDPOINT, timeout=10)
+        return _relay_listing(response)
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error getting agents: {e}")
+        logger.error("Error getting agents: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/models/<provider>', methods=['GET'])
 def get_models_for_provider(provider):
     """Get list of available models for a specific provider from MCP server."""
     try:
-        response = requests.get(f"{MODELS_ENDPOINT}/{provider}")
-        response.raise_for_status()
-        return jsonify(response.json()), response.status_code
+        # Relay MCP error statuses (404 for an unknown provider, 503) and their JSON bodies as-is
+        response = _mcp_session.get(f"{MODELS_ENDPOINT}/{provider}", timeout=10)
+        return _relay_listing(response)
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error getting models for provider {provider}: {e}")
+        logger.error("Error getting models for provider %s: %s", provider, e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/model-description/<provider>/<model>', methods=['GET'])
@@ -393,70 +353,126 @@ def api_model_description(provider, model):
     Returns: {"description": <description>}
     """
 
-    # Forward the request to the MCP server (new endpoint to be implemented)
     try:
-        url = f"{MCP_SERVER_URL}/mcp/v1/model-description/{provider}/{model}"
-        resp = requests.get(url)
-        if resp.ok:
-            data = resp.json()
-            return jsonify({"description": data.get("description", "No description available.")})
-        else:
-            return jsonify({"description": "No description available."}), 404
+        description = _get_model_description(provider, model)
+        if description is None:
+            return _json_bytes_response(NO_DESCRIPTION, 404)
+        response = jsonify({"description": description})
+        # Descriptions are static per provider/model, so let browsers and proxies reuse them
+        response.headers['Cache-Control'] = 'public, max-age=3600'
+        return _conditional(response)
     except Exception as e:
-        logger.error(f"Failed to fetch model description: {e}")
-        return jsonify({"description": "No description available."}), 500
+        logger.error("Failed to fetch model description: %s", e)
+        return _json_bytes_response(NO_DESCRIPTION, 500)
 
 # Private
 
+def _execute_params(data):
+    """Query params for /mcp/v1/execute; ?no_cache=1 (or "no_cache": true in the body) skips the MCP response cache."""
+    if request.args.get('no_cache') == '1' or data.get('no_cache') in (True, 1, '1'):
+        return {'no_cache': '1'}
+    return None
+
+def _relay_execute_response(response):
+    """Relay the MCP execute body as-is instead of decoding and re-encoding it, keeping its X-Cache header."""
+    relayed = Response(response.content, status=response.status_code, mimetype='application/json')
+    if 'X-Cache' in response.headers:
+        relayed.headers['X-Cache'] = response.headers['X-Cache']
+    return relayed
+
+def _relay_listing(response):
+    """Relay an MCP provider/model listing as-is, keeping its Cache-Control header."""
+    relayed = Response(response.content, status=response.status_code, mimetype='application/json')
+    if 'Cache-Control' in response.headers:
+        relayed.headers['Cache-Control'] = response.headers['Cache-Control']
+    return _conditional(relayed)
+
+def _conditional(response):
+    """Tag a successful GET response with a content ETag and answer 304 if the client's If-None-Match matches."""
+    if response.status_code != 200:
+        return response
+    response.add_etag()
+    return response.make_conditional(request)
+
+def _get_model_description(provider, model):
+    """
+    Return the model description from the MCP server, or None if it has none.
+    Descriptions are cached per provider/model for MODEL_DESCRIPTION_TTL seconds.
+    """
+    key = (provider, model)
+    now = time.monotonic()
+    with _model_descriptions_lock:
+        entry = _model_descriptions.get(key)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+    resp = _mcp_session.get(f"{MODEL_DESCRIPTION_ENDPOINT}/{provider}/{model}", timeout=10)
+    if not resp.ok:
+        return None
+    description = orjson.loads(resp.content).get("description", "No description available.")
+    with _model_descriptions_lock:
+        if key not in _model_descriptions and len(_model_descriptions) >= MODEL_DESCRIPTIONS_MAX:
+            # Evict the oldest entry; dicts keep insertion order
+            _model_descriptions.pop(next(iter(_model_descriptions)))
+        _model_descriptions[key] = (now + MODEL_DESCRIPTION_TTL, description)
+    return description
+
+def _fetch_providers():
+    """Fetch the provider listing from the MCP server as a dict."""
+    response = _mcp_session.get(PROVIDERS_ENDPOINT, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _fetch_models(provider):
+    """Fetch the model listing for one provider from the MCP server as a dict."""
+    response = _mcp_session.get(f"{MODELS_ENDPOINT}/{provider}", timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _fetch_models_or_empty(provider):
+    """_fetch_models() that logs a failed fetch and returns an empty listing instead of raising."""
+    try:
+        return _fetch_models(provider)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        logger.error("Error getting models for provider %s: %s", provider, e)
+        return {}
+
 def _get_available_models():
+    """
+    Return available models, served from a short-lived cache.
+    Refetches from the MCP server once AVAILABLE_MODELS_TTL has passed; failures are not cached.
+    """
+    with _available_models_lock:
+        if _available_models_cache['models'] is not None and time.monotonic() < _available_models_cache['expires_at']:
+            return _available_models_cache['models']
+    available_models = _fetch_available_models()
+    if available_models:
+        with _available_models_lock:
+            _available_models_cache['models'] = available_models
+            _available_models_cache['expires_at'] = time.monotonic() + AVAILABLE_MODELS_TTL
+    return available_models
+
+def _fetch_available_models():
     """
     Get available models from MCP server and format them for the frontend.
     Returns a plain dict (not Flask Response) for internal use.
     """
-    import os
     available_models = {}
     try:
-        mock_env = os.environ.get('MOCK_MCP', '0')
-        print(f'[DEBUG] MOCK_MCP env: {mock_env}')
-        # Call get_providers() to get the list of providers
-        providers_result = get_providers()
-        # Extract data from Flask Response or tuple
-        if hasattr(providers_result, 'get_json'):
-            providers_data = providers_result.get_json()
-        elif isinstance(providers_result, tuple):
-            providers_data = providers_result[0].get_json()
-        else:
-            providers_data = providers_result
-        print(f'[DEBUG] providers_data: {providers_data}')
+        providers_data = _fetch_providers()
+        logger.debug('providers_data: %s', providers_data)
         providers = providers_data.get('providers', [])
-        print(f'[DEBUG] providers: {providers}')
-        mock_mode = mock_env == '1'
-        for provider in providers:
-            # Use raw=True for mock mode to get plain dict, not Flask Response
-            if mock_mode:
-                models_data = get_models_for_provider(provider)
-                print(f'[DEBUG] models_data for provider {provider} (mock): {models_data}')
-            else:
-                models_result = get_models_for_provider(provider)
-                if hasattr(models_result, 'get_json'):
-                    models_data = models_result.get_json()
-                elif isinstance(models_result, tuple):
-                    models_data = models_result[0].get_json()
-                else:
-                    models_data = models_result
-                print(f'[DEBUG] models_data for provider {provider}: {models_data}')
-            # Unwrap Flask Response if needed (for mock MCP)
-            if isinstance(models_data, tuple) and hasattr(models_data[0], 'get_json'):
-                models_data = models_data[0].get_json()
-            elif hasattr(models_data, 'get_json'):
-                models_data = models_data.get_json()
+        logger.debug('providers: %s', providers)
+        # Fetch the per-provider listings concurrently; map() keeps provider order
+        for provider, models_data in zip(providers, _listing_pool.map(_fetch_models_or_empty, providers)):
+            logger.debug('models_data for provider %s: %s', provider, models_data)
             # Defensive: support both list/dict for backward compatibility
             if isinstance(models_data, list):
                 models_list = models_data
             elif isinstance(models_data, dict) and 'models' in models_data:
                 models_list = models_data['models']
             else:
-                logger.error(f"Unexpected models_data for provider {provider}: {models_data}")
+                logger.error("Unexpected models_data for provider %s: %s", provider, models_data)
                 models_list = []
             ids = []
             for model in models_list:
@@ -465,13 +481,13 @@ def _get_available_models():
                 elif isinstance(model, str):
                     ids.append(model)
                 else:
-                    logger.error(f"Model entry for provider {provider} has no 'id': {model}")
+                    logger.error("Model entry for provider %s has no 'id': %s", provider, model)
             available_models[provider] = ids
-        print('[get_available_models] available_models:', available_models)
+        logger.debug('available_models: %s', available_models)
         # Return as plain dict for internal use (not Flask Response)
         return available_models
     except Exception as e:
-        logger.error(f"Error getting available models: {e}")
+        logger.error("Error getting available models: %s", e)
         # Always return empty dict on error
         return {}
 
@@ -479,11 +495,20 @@ def _get_available_models():
 @app.route('/api/available-models')
 def api_available_models():
     """API endpoint to get available models as JSON."""
-    return jsonify(_get_available_models())
+    available_models = _get_available_models()
+    response = jsonify(available_models)
+    if not available_models:
+        # Empty means the MCP fetch failed; don't let browsers or proxies keep it
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    response.headers['Cache-Control'] = f'public, max-age={int(AVAILABLE_MODELS_TTL)}'
+    return _conditional(response)
 
 # ... (rest of the code remains the same)
 
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 10000)) 
-    logger.info(f"Starting Flask application server on http://0.0.0.0:{port}")
-    app.run(debug=True, host='0.0.0.0', port=port)
\ No newline at end of file
+    # Debugger and reloader are opt-in for local development (FLASK_DEBUG=1)
+    debug = os.environ.get("FLASK_DEBUG", "0") == "1"
+    logger.info("Starting Flask application server on http://0.0.0.0:%s (debug=%s)", port, debug)
+    app.run(debug=debug, host='0.0.0.0', port=port)
\ No newline at end of file
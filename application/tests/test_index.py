@@ -0,0 +1,17 @@
+import unittest
+
+import app as app_module
+
+
+class IndexPageTest(unittest.TestCase):
+    def test_asset_urls_use_static_content_version(self):
+        version = app_module._static_assets_version()
+        self.assertEqual(version, app_module.app.jinja_env.globals["asset_version"])
+
+        html = app_module.app.test_client().get("/").get_data(as_text=True)
+        self.assertIn(f"main.js?v={version}", html)
+        self.assertIn(f"style.css?v={version}", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+import app as app_module
+
+
+def _mcp_response(status_code, body):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+class CountingMCPServer(ThreadingHTTPServer):
+    """Local stand-in for the MCP server that answers every GET with a fixed status."""
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+        self.requests = 0
+        super().__init__(("127.0.0.1", 0), CountingHandler)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        self.send_response(self.server.status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ListingProxyTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app_module.app.test_client()
+        # Start every test with an empty available-models cache
+        mock.patch.dict(app_module._available_models_cache, {'models': None, 'expires_at': 0.0}).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def _serve(self, status_code, body):
+        """Point the providers listing at a local server, going through the real MCP adapter and its Retry."""
+        server = CountingMCPServer(status_code, body)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        session = app_module._mcp_session
+        session.mount(server.url, session.get_adapter(app_module.PROVIDERS_ENDPOINT))
+        self.addCleanup(session.adapters.pop, server.url)
+        mock.patch.object(app_module, "PROVIDERS_ENDPOINT", f"{server.url}/mcp/v1/providers").start()
+        return server
+
+    def test_unknown_provider_returns_404(self):
+        body = b'{"success":false,"error":"Provider \'nope\' not found","error_type":"configuration_error"}'
+        with mock.patch.object(app_module._mcp_session, "get", return_value=_mcp_response(404, body)):
+            response = self.client.get("/api/models/nope")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()["error_type"], "configuration_error")
+        self.assertNotIn("ETag", response.headers)
+
+    def test_no_providers_returns_503(self):
+        body = b'{"success":false,"error":"No providers loaded","error_type":"server_error"}'
+        with mock.patch.object(app_module._mcp_session, "get", return_value=_mcp_response(503, body)):
+            response = self.client.get("/api/providers")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.get_json()["error"], "No providers loaded")
+
+    def test_listing_503_is_not_retried(self):
+        server = self._serve(503, b'{"success":false,"error":"No providers loaded","error_type":"server_error"}')
+
+        response = self.client.get("/api/providers")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(server.requests, 1)
+
+    def test_listing_502_is_retried(self):
+        server = self._serve(502, b'{"success":false,"error":"Bad gateway"}')
+
+        response = self.client.get("/api/providers")
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(server.requests, 3)
+
+    def test_failed_available_models_fetch_is_not_cached(self):
+        with mock.patch.object(app_module, "_fetch_available_models", return_value={}):
+            response = self.client.get("/api/available-models")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Cache-Control"], "no-store")
+        self.assertNotIn("ETag", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for production servers.
+
+Usage:
+    gunicorn --worker-class gthread --workers 2 --threads 16 wsgi:app
+"""
+from app import app
+
+application = app
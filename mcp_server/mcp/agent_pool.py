@@ -0,0 +1,56 @@
+"""
+Pool of constructed agent instances for /mcp/v1/execute.
+
+Building an agent creates a provider SDK client (and, for OpenAI, probes the
+API), so instances are reused across requests. They are keyed by agent class
+and a hash of the API key, so raw keys are never used as dictionary keys.
+
+Configuration (environment variables):
+    MCP_AGENT_POOL_SIZE  Maximum number of pooled agents (default: 64).
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Type
+
+from .agents.base_agent import AgentProtocol
+
+AGENT_POOL_SIZE = int(os.getenv("MCP_AGENT_POOL_SIZE", 64))
+
+
+class AgentPool:
+    """Thread-safe LRU pool of agent instances keyed by (agent class, API key hash)."""
+
+    def __init__(self, maxsize: int = AGENT_POOL_SIZE):
+        self.maxsize = maxsize
+        self._agents: "OrderedDict[Tuple[type, str], AgentProtocol]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, agent_class: Type[AgentProtocol], api_key: Optional[str] = None) -> AgentProtocol:
+        """Return a pooled agent for agent_class/api_key, constructing it on first use."""
+        key = (agent_class, hashlib.sha256(api_key.encode()).hexdigest() if api_key else "")
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is not None:
+                self._agents.move_to_end(key)
+                return agent
+
+        # Construct outside the lock: agent setup may call the provider API.
+        # Failures propagate to the caller and nothing is pooled.
+        agent = agent_class(api_key=api_key)
+        if self.maxsize <= 0:
+            return agent
+        with self._lock:
+            agent = self._agents.setdefault(key, agent)
+            self._agents.move_to_end(key)
+            while len(self._agents) > self.maxsize:
+                self._agents.popitem(last=False)
+        return agent
+
+    def clear(self) -> None:
+        with self._lock:
+            self._agents.clear()
+
+
+agent_pool = AgentPool()
@@ -8,17 +8,18 @@ and validate questions using the Claude language models.
 
 import json
 import sys
-import os
 import logging
+from types import MappingProxyType
 import time
 import anthropic
 from typing import Dict, List, Optional, Any, Callable
 import demjson3  # For tolerant JSON-like parsing
 
 # Import escape_json_strings utility for cleaning AI responses
-from mcp.agents.utils import escape_json_strings, remove_triple_backticks_from_outer_markdown, fix_unterminated_strings_in_json
+from mcp.agents.utils import escape_json_strings, remove_triple_backticks_from_outer_markdown, fix_unterminated_strings_in_json, env_api_key
 
 from mcp.agents.base_agent import AgentProtocol
+from mcp.agents.http_client import shared_http_client
 from mcp.agents.ai_models import (
     AIModel, 
     AIStatistic, 
@@ -39,6 +40,30 @@ from mcp.agents.ai_models import (
 
 logger = logging.getLogger(__name__)
 
+SUPPORTED_MODELS = (
+    "claude-3-7-sonnet",
+    "claude-3-5-sonnet",
+    # "claude-3-5-haiku",
+    # "claude-3-5-opus"
+)
+_SUPPORTED_MODELS_SET = frozenset(SUPPORTED_MODELS)
+
+# Short model name -> Anthropic API model id
+MODEL_ID_MAP = MappingProxyType({
+    "claude-3-5-haiku": "claude-3-5-haiku-latest",
+    "claude-3-5-sonnet": "claude-3-5-sonnet-latest",
+    "claude-3-5-opus": "claude-3-5-opus-latest",
+    "claude-3-7-sonnet": "claude-3-7-sonnet-latest",
+})
+
+# Output token limit per short model name (default 4096)
+MAX_TOKENS_BY_MODEL = MappingProxyType({
+    "claude-3-7-sonnet": 15000,
+    "claude-3-5-sonnet": 8192,
+    "claude-3-5-haiku": 8192,
+    "claude-3-5-opus": 8192,
+})
+
 class ClaudeAgent(AgentProtocol):
     """
     Agent implementation for Claude API (Anthropic).
@@ -57,14 +82,14 @@ class ClaudeAgent(AgentProtocol):
         Args:
             api_key: The Claude API key. If not provided, it will try to get it from environment variable.
         """
-        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self.api_key = api_key or env_api_key("ANTHROPIC_API_KEY")
         if not self.api_key:
             logger.warning("No Claude API key provided, agent will not function properly")
         
         # Initialize Claude client
         self.client = None
         if self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.client = anthropic.Anthropic(api_key=self.api_key, http_client=shared_http_client())
         
         # tools property is implemented below as required by AgentProtocol
 
@@ -89,12 +114,7 @@ class ClaudeAgent(AgentProtocol):
         Returns:
             List of supported model names
         """
-        return [
-            "claude-3-7-sonnet",
-            "claude-3-5-sonnet",
-            # "claude-3-5-haiku",
-            # "claude-3-5-opus"
-        ]
+        return list(SUPPORTED_MODELS)
 
     @staticmethod
     def models_description(model: str) -> str:
@@ -148,23 +168,19 @@ Most expensive to use
         return "Unknown model"
 
     def _max_tokens_for_model(self, model_name:str) -> int:
-        if model_name.lower() in ["claude-3-7-sonnet"]:
-            return 15000
-        if model_name.lower() in ["claude-3-5-sonnet", "claude-3-5-haiku", "claude-3-5-opus"]:
-            return 8192
-        return 4096
+        return MAX_TOKENS_BY_MODEL.get(model_name.lower(), 4096)
 
     def generate(self, request: AIRequestQuestionModel) -> AIQuestionModel:
         """
         Generate a programming question using Claude.
         """
        
-        print(f"Python version={sys.version}")
+        logger.debug("Python version=%s", sys.version)
         try:
-            print(f"Anthropic version={getattr(anthropic, '__version__', 'unknown')}")
+            logger.debug("Anthropic version=%s", getattr(anthropic, '__version__', 'unknown'))
         except Exception:
-            print("Anthropic version=unknown")
-        print(f"GENERATE: {request}")
+            logger.debug("Anthropic version=unknown")
+        logger.debug("GENERATE: %s", request)
 
         model_name = request.model.model
         full_model_name = self._convert_model_name(model_name)
@@ -172,7 +188,7 @@ Most expensive to use
         start_time = time.time()
 
         try:
-            if model_name not in self.supported_models():
+            if model_name not in _SUPPORTED_MODELS_SET:
                 logger.warning(f"Requested model {model_name} is not officially supported. Attempting to use anyway.")
            
             prompt = self._format_question_request(request)
@@ -217,7 +233,7 @@ Most expensive to use
         logger.info(f"Claude model (short): {model_name}, (full): {full_model_name}")
         start_time = time.time()
         try:
-            if model_name not in self.supported_models():
+            if model_name not in _SUPPORTED_MODELS_SET:
                 logger.warning(f"Requested model {model_name} is not officially supported. Attempting to use anyway.")
             prompt = self._format_validation_request(request)
             system_prompt = self._create_system_prompt("validate")
@@ -297,9 +313,9 @@ Most expensive to use
         except Exception:
             logger.info("Anthropic version=unknown")
         
-        print(f"Python version={sys.version}")
-        print(f"Anthropic version={getattr(anthropic, '__version__', 'unknown')}")
-        print(f"USER QUIZ: {request}")
+        logger.debug("Python version=%s", sys.version)
+        logger.debug("Anthropic version=%s", getattr(anthropic, '__version__', 'unknown'))
+        logger.debug("USER QUIZ: %s", request)
 
         model_name = request.model.model
         full_model_name = self._convert_model_name(model_name)
@@ -351,13 +367,7 @@ Most expensive to use
     
     @staticmethod
     def _convert_model_name(short_name):
-        model_map = {
-            "claude-3-5-haiku": "claude-3-5-haiku-latest",
-            "claude-3-5-sonnet": "claude-3-5-sonnet-latest",
-            "claude-3-5-opus": "claude-3-5-opus-latest",
-            "claude-3-7-sonnet": "claude-3-7-sonnet-latest",
-        }
-        return model_map.get(short_name, short_name)
+        return MODEL_ID_MAP.get(short_name, short_name)
     
     def _format_quiz_request(self, request: AIRequestQuestionModel) -> str:
         """
@@ -378,7 +388,7 @@ Most expensive to use
             "Example: {\n  \"topic\": { \"name\": \"SwiftUI\", \"platform\": \"iOS\", \"technology\": \"Swift\" },\n  \"question\": \"Implement a SwiftUI view that displays a list of items and allows users to delete items with a swipe gesture. The list should update automatically when an item is deleted.\",\n  \"tags\": [\"SwiftUI\", \"List\", \"iOS\", \"Delete\", \"Swipe\"]\n}"
         )
         # Log the prompt for debugging
-        print(f"Claude quiz prompt={prompt}")
+        logger.debug("Claude quiz prompt=%s", prompt)
         return prompt
     
     def _create_agent_model(self, ai_model: AIModel, start_time: float, token_count: Optional[int] = None) -> AgentModel:
@@ -761,7 +771,8 @@ Return only the JSON without any other text or explanations.
             cleaned_response = escape_json_strings(fixed_response)
             # Try to parse the cleaned response as JSON
             data = json.loads(cleaned_response)
-            logger.info(f"Claude parsed JSON: {json.dumps(data, ensure_ascii=False, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Claude parsed JSON: %s", json.dumps(data, ensure_ascii=False))
         except json.JSONDecodeError:
             # If that fails, try to find JSON within the text
             import re
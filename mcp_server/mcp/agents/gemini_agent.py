@@ -6,17 +6,17 @@ that follows the MCP protocol. It provides functionality to generate
 and validate questions using the Gemini language models.
 """
 
-import os
 import logging
 import time
 from typing import Dict, List, Optional, Callable, Any
 import demjson3
 from mcp.agents.ai_models import (QuestionModel, QuizModel, QuestionValidation, RequestQuestionModel, AIUserQuizModel, UserQuizModel)
-from mcp.agents.utils import remove_triple_backticks_from_outer_markdown, fix_unterminated_strings_in_json, escape_newlines_in_json_strings
+from mcp.agents.utils import remove_triple_backticks_from_outer_markdown, fix_unterminated_strings_in_json, escape_newlines_in_json_strings, env_api_key
 import demjson3, json, re
 
 # Correct import for google-generativeai
 import google.generativeai as genai
+import google.ai.generativelanguage as glm
 from mcp.agents.base_agent import AgentProtocol
 from mcp.agents.ai_models import (
     AIModel,
@@ -37,6 +37,10 @@ from mcp.agents.ai_models import (
 
 logger = logging.getLogger(__name__)
 
+# Full Gemini model names as used by the API
+SUPPORTED_MODELS = ("gemini-1.5-pro-latest", "gemini-2.0-flash")
+_SUPPORTED_MODELS_SET = frozenset(SUPPORTED_MODELS)
+
 class GeminiAgent(AgentProtocol):
     """
     Agent implementation for Gemini API (Google).
@@ -48,12 +52,21 @@ class GeminiAgent(AgentProtocol):
         Args:
             api_key: The Gemini API key. If not provided, it will try to get it from environment variable.
         """
-        self.api_key = api_key or os.environ.get("GOOGLE_API_KEY")
+        self.api_key = api_key or env_api_key("GOOGLE_API_KEY")
         if not self.api_key:
             logger.warning("No Gemini API key provided, agent will not function properly")
-        # Configure Gemini API key for global use
-        import google.generativeai as genai
-        genai.configure(api_key=self.api_key)
+        # Each agent gets its own client carrying its own key. genai.configure() is
+        # process-global, and pooled agents with different keys run concurrently.
+        self._client = glm.GenerativeServiceClient(client_options={"api_key": self.api_key}) if self.api_key else None
+
+    def _generate_content(self, model_name: str, contents, generation_config: Dict[str, Any]):
+        """Call Gemini generate_content through this agent's own client."""
+        if self._client is None:
+            # Never fall back to the SDK's global default client: it may hold another agent's key
+            raise ValueError("No Gemini API key configured")
+        model = genai.GenerativeModel(model_name)
+        model._client = self._client
+        return model.generate_content(contents, generation_config=generation_config)
 
     @property
     def tools(self) -> Dict[str, Callable]:
@@ -75,11 +88,7 @@ class GeminiAgent(AgentProtocol):
     @staticmethod
     def supported_models() -> List[str]:
         """Returns list of supported Gemini models."""
-        # Use full Gemini model names for API
-        return [
-            "gemini-1.5-pro-latest",
-            "gemini-2.0-flash"
-        ]
+        return list(SUPPORTED_MODELS)
 
     @staticmethod
     def models_description(model: str) -> str:
@@ -135,19 +144,19 @@ Good choice for interactive applications, chatbots, and assistance tools
         logger.info(f"Python version={sys.version}")
         try:
             import google.generativeai as genai
-            logger.info(f"Google GenerativeAI version={getattr(genai, '__version__', 'unknown')}")
+            logger.debug("Google GenerativeAI version=%s", getattr(genai, '__version__', 'unknown'))
         except Exception:
-            logger.info("Google GenerativeAI version=unknown")
+            logger.debug("Google GenerativeAI version=unknown")
         model_name = request.model.model
         logger.info(f"Gemini model: {model_name}, request type: generate")
-        if model_name not in self.supported_models():
+        if model_name not in _SUPPORTED_MODELS_SET:
             logger.warning(f"Requested model {model_name} is not officially supported. Attempting to use anyway.")
         start_time = time.time()
         prompt = self._format_question_request(request)
         try:
-            # Use official method: create model and call generate_content
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(
+            # Call generate_content through this agent's own client (see _generate_content)
+            response = self._generate_content(
+                model_name,
                 [prompt],
                 generation_config={"temperature": request.temperature, "max_output_tokens": 15000}
             )
@@ -174,19 +183,19 @@ Good choice for interactive applications, chatbots, and assistance tools
         logger.info(f"Python version={sys.version}")
         try:
             import google.generativeai as genai
-            logger.info(f"Google GenerativeAI version={getattr(genai, '__version__', 'unknown')}")
+            logger.debug("Google GenerativeAI version=%s", getattr(genai, '__version__', 'unknown'))
         except Exception:
-            logger.info("Google GenerativeAI version=unknown")
+            logger.debug("Google GenerativeAI version=unknown")
         model_name = request.model.model
         logger.info(f"Gemini model: {model_name}, request type: validate")
-        if model_name not in self.supported_models():
+        if model_name not in _SUPPORTED_MODELS_SET:
             logger.warning(f"Requested model {model_name} is not officially supported. Attempting to use anyway.")
         start_time = time.time()
         prompt = self._format_validation_request(request)
         try:
-            # Use official method: create model and call generate_content
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(
+            # Call generate_content through this agent's own client (see _generate_content)
+            response = self._generate_content(
+                model_name,
                 [prompt],
                 generation_config={"temperature": request.temperature, "max_output_tokens": 15000}
             )
@@ -213,19 +222,19 @@ Good choice for interactive applications, chatbots, and assistance tools
         logger.info(f"Python version={sys.version}")
         try:
             import google.generativeai as genai
-            logger.info(f"Google GenerativeAI version={getattr(genai, '__version__', 'unknown')}")
+            logger.debug("Google GenerativeAI version=%s", getattr(genai, '__version__', 'unknown'))
         except Exception:
-            logger.info("Google GenerativeAI version=unknown")
+            logger.debug("Google GenerativeAI version=unknown")
         model_name = request.model.model
         logger.info(f"Gemini model: {model_name}, request type: quiz")
-        if model_name not in self.supported_models():
+        if model_name not in _SUPPORTED_MODELS_SET:
             logger.warning(f"Requested model {model_name} is not officially supported. Attempting to use anyway.")
         start_time = time.time()
         prompt = self._format_quiz_request(request)
         try:
-            # Use official method: create model and call generate_content
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(
+            # Call generate_content through this agent's own client (see _generate_content)
+            response = self._generate_content(
+                model_name,
                 [prompt],
                 generation_config={"temperature": request.temperature, "max_output_tokens": 2048}
             )
@@ -253,16 +262,16 @@ Good choice for interactive applications, chatbots, and assistance tools
         logger.info(f"Python version={sys.version}")
         try:
             import google.generativeai as genai
-            logger.info(f"Google GenerativeAI version={getattr(genai, '__version__', 'unknown')}")
+            logger.debug("Google GenerativeAI version=%s", getattr(genai, '__version__', 'unknown'))
         except Exception:
-            logger.info("Google GenerativeAI version=unknown")
+            logger.debug("Google GenerativeAI version=unknown")
         
-        print(f"Python version={sys.version}")
-        print(f"USER QUIZ: {request}")
+        logger.debug("Python version=%s", sys.version)
+        logger.debug("USER QUIZ: %s", request)
 
         model_name = request.model.model
         logger.info(f"Gemini model: {model_name}, request type: user_quiz")
-        if model_name not in self.supported_models():
+        if model_name not in _SUPPORTED_MODELS_SET:
             logger.warning(f"Requested model {model_name} is not officially supported. Attempting to use anyway.")
 
         # Either both topic and platform must be provided, or the question field must be non-empty
@@ -272,9 +281,9 @@ Good choice for interactive applications, chatbots, and assistance tools
         try:
             start_time = time.time()
 
-            # Use official method: create model and call generate_content
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(
+            # Call generate_content through this agent's own client (see _generate_content)
+            response = self._generate_content(
+                model_name,
                 [self._format_quiz_from_student_answer_system_prompt(), self._format_quiz_from_student_answer_prompt(request.request)],
                 generation_config={"temperature": request.temperature, "max_output_tokens": 2048}
             )
@@ -405,7 +414,7 @@ Question to validate: {request.request.model_dump_json()}
             "\n  \"tags\": [\"SwiftUI\", \"List\", \"iOS\", \"Delete\", \"Swipe\"]"
             "\n}"
         )
-        print(f"Gemini quiz prompt={prompt}")
+        logger.debug("Gemini quiz prompt=%s", prompt)
         return prompt
 
     def _parse_gemini_response(self, response_text: str, schema_type: str) -> Any:
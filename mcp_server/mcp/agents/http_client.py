@@ -0,0 +1,22 @@
+"""
+Process-wide HTTP client shared by the provider SDK clients.
+
+Sharing one httpx.Client lets every OpenAI/Anthropic client reuse the same
+keep-alive (HTTP/2) connections instead of opening a new pool per agent.
+"""
+import atexit
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def shared_http_client() -> httpx.Client:
+    """Return the shared httpx.Client, creating it on first use."""
+    client = httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(120.0, connect=10.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+    )
+    atexit.register(client.close)
+    return client
@@ -2,20 +2,97 @@ import os
 import sys
 import time
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Callable, List
 import openai
 from openai import OpenAI
 import json
-import tiktoken
 from dotenv import load_dotenv
 
 from ..agents.ai_models import (QuestionModel, AIQuestionModel, AIValidationModel, 
                                 AIRequestQuestionModel, AIRequestValidationModel, 
                                 AIModel, AIStatistic, AgentModel, RequestQuestionModel, QuestionValidation, AIQuizModel, UserQuizModel, AIUserQuizModel)
 from ..agents.base_agent import AgentProtocol
+from ..agents.http_client import shared_http_client
+from ..agents.utils import env_api_key
 
 logger = logging.getLogger(__name__)
 
+# Process-wide setup done once at import rather than on every agent construction
+os.environ['PYDANTIC_PRIVATE_ALLOW_UNHANDLED_SCHEMA_TYPES'] = '1'
+load_dotenv()
+
+# Static part of the validation prompt (criteria and response format)
+VALIDATION_INSTRUCTIONS = """You are a quality assurance expert for programming educational content. Your task is to validate the question at the end of this message against specific criteria and provide a detailed assessment.
+
+## Validation Criteria
+
+### Basic Validation (Boolean Fields)
+For each criterion below, provide a true/false assessment:
+1. Is the question text clear, specific, and not generic? (is_text_clear)
+2. Does the question correspond to the topic and tags? (is_question_correspond)
+3. Is the question challenging and not trivial? (is_question_not_trivial)
+4. Does the question have all three difficulty levels? (do_answer_levels_exist)
+5. Are the answer levels valid (Beginner/Intermediate/Advanced)? (are_answer_levels_valid)
+6. Does each answer level have evaluation criteria? (has_evaluation_criteria)
+7. Are the answer levels different and match their difficulty? (are_answer_levels_different)
+8. Does each answer level contain exactly 3 tests? (do_tests_exist)
+9. Does the question have appropriate tags? (do_tags_exist)
+10. Do all tests have more than 2 options? (do_test_options_exist)
+11. Is the question text original? (is_question_text_different_from_existing_questions)
+12. Are test options properly numbered? (are_test_options_numbered)
+13. Do test answers correspond to valid option numbers? (does_answer_contain_option_number)
+14. Are code blocks properly formatted? (are_code_blocks_marked_if_they_exist)
+15. Do test snippets have questions? (does_snippet_have_question)
+16. Do test snippets have code? (does_snippet_have_code)
+
+### Scoring Criteria (1-10)
+For each aspect below, provide a score from 1 to 10:
+1. Clarity and specificity of the question (clarity_score)
+2. Relevance to topic and tags (relevance_score)
+3. Appropriate difficulty level (difficulty_score)
+4. Structure and organization (structure_score)
+5. Code examples quality (code_quality_score)
+6. Overall quality (quality_score)
+
+### Detailed Feedback
+For each scoring criterion above, provide detailed feedback explaining:
+- What works well
+- What needs improvement
+- Specific suggestions for enhancement
+
+### General Assessment
+- General comments about the question (comments)
+- List of specific recommendations for improvement (recommendations)
+- Pass/Fail status based on quality score (passed = quality_score >= 7)
+
+## Response Format
+Your response should include:
+1. Boolean values for all basic validation criteria
+2. Numerical scores (1-10) for each aspect
+3. Detailed feedback for each aspect
+4. Overall quality score
+5. General comments
+6. List of specific recommendations
+7. Pass/Fail status
+"""
+
+@lru_cache(maxsize=None)
+def _encoding_for_model(model: str):
+    """Tokenizer for the model, built once per model. tiktoken is imported on first use."""
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+SUPPORTED_MODELS = ("gpt-4o", "gpt-4o-mini", "o3-mini", "o4-mini")
+_SUPPORTED_MODELS_LOWER = frozenset(m.lower() for m in SUPPORTED_MODELS)
+# Models that take 'max_completion_tokens' instead of 'max_tokens'
+_MAX_COMPLETION_TOKENS_MODELS = ('o4-mini', 'o3-mini', 'gpt-4o-mini', 'gpt-4o')
+# Models that only accept the default temperature
+_DEFAULT_TEMPERATURE_ONLY_MODELS = ('o4-mini', 'o3-mini', 'gpt-4o-mini', 'gpt-4o')
+
 class OpenAIAgent(AgentProtocol):
     """OpenAI API agent for MCP server implementing AgentProtocol."""
     
@@ -27,12 +104,7 @@ class OpenAIAgent(AgentProtocol):
     @staticmethod
     def supported_models() -> List[str]:
         """Returns list of supported models."""
-        return [
-            "gpt-4o", 
-            "gpt-4o-mini",
-            "o3-mini",
-            "o4-mini"
-        ]
+        return list(SUPPORTED_MODELS)
         
     @staticmethod
     def models_description(model: str) -> str:
@@ -90,15 +162,13 @@ Suitable for embedding in applications requiring quick responses
 
     def __init__(self, api_key: Optional[str] = None):
         """Initialize OpenAI agent for MCP server integration."""
-        os.environ['PYDANTIC_PRIVATE_ALLOW_UNHANDLED_SCHEMA_TYPES'] = '1'
-        load_dotenv()
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.api_key = api_key or env_api_key("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
         # Check OpenAI API version
         try:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = OpenAI(api_key=self.api_key, http_client=shared_http_client())
             # Test API connection
             self.client.models.list()
             logger.info("Successfully connected to OpenAI API")
@@ -132,9 +202,9 @@ Suitable for embedding in applications requiring quick responses
             ValueError: If response parsing fails
         """
 
-        print(f"Python version={sys.version}")
-        print(f"OpenAI version={openai.__version__}")
-        print(f"GENERATE: {request}")
+        logger.debug("Python version=%s", sys.version)
+        logger.debug("OpenAI version=%s", openai.__version__)
+        logger.debug("GENERATE: %s", request)
 
         if not self._is_support_model(request.model):
             raise ValueError(f"Unsupported model: {request.model.model}")
@@ -188,9 +258,9 @@ Suitable for embedding in applications requiring quick responses
         Generate a programming question (without answers/tests) through OpenAI, according to the QuizModel/AIQuizModel.
         """
 
-        print(f"Python version={sys.version}")
-        print(f"OpenAI version={openai.__version__}")
-        print(f"QUIZ: {request}")
+        logger.debug("Python version=%s", sys.version)
+        logger.debug("OpenAI version=%s", openai.__version__)
+        logger.debug("QUIZ: %s", request)
 
         if not self._is_support_model(request.model):
             raise ValueError(f"Unsupported model: {request.model.model}")
@@ -242,9 +312,9 @@ Suitable for embedding in applications requiring quick responses
         Generate a programming question (without answers/tests) through OpenAI, according to the QuizModel/AIQuizModel.
         """
 
-        print(f"Python version={sys.version}")
-        print(f"OpenAI version={openai.__version__}")
-        print(f"USER QUIZ: {request}")
+        logger.debug("Python version=%s", sys.version)
+        logger.debug("OpenAI version=%s", openai.__version__)
+        logger.debug("USER QUIZ: %s", request)
 
         if not self._is_support_model(request.model):
             raise ValueError(f"Unsupported model: {request.model.model}")
@@ -308,8 +378,8 @@ Suitable for embedding in applications requiring quick responses
             RuntimeError: For API or validation errors
         """
 
-        print(f"Python version={sys.version}")
-        print(f"OpenAI version={openai.__version__}")
+        logger.debug("Python version=%s", sys.version)
+        logger.debug("OpenAI version=%s", openai.__version__)
 
         if not self._is_support_model(request.model):
             raise ValueError(f"Unsupported model: {request.model.model}")
@@ -455,20 +525,21 @@ The response must be a single JSON object that matches the defined structure, wi
 
     def _make_generate_prompt(self, request: RequestQuestionModel) -> str:
         r = request
+        # Fixed instructions first and request fields last, to keep the prompt prefix identical across requests
         return (
-            f"Generate a programming question with detailed structure for:\n"
-            f"- Topic: '{r.topic}'\n"
-            f"- Platform: '{r.platform}'\n"
-            f"{f'- Technology: {r.technology}' if r.technology else ''}\n"
-            f"- Tags: {', '.join(r.tags) if r.tags else 'None'}\n"
-            f"- Prompt idea: '{r.question if r.question else 'None provided'}'\n\n"
             f"The main programming question must be **theoretical** (e.g., explain concepts, differences, principles).\n"
             f"The three answer levels (Beginner, Intermediate, Advanced) must each include:\n"
             f"1. A detailed answer (theoretical or practical depending on the level)\n"
             f"2. 3 multiple-choice test questions (more practical, involve coding or analysis)\n"
             f"3. Evaluation criteria (knowledge, skills, concepts).\n\n"
             f"Use correct language tags for code blocks if needed. Do not use any markdown section titles. "
-            f"Return structured output as a single JSON object without any additional commentary."
+            f"Return structured output as a single JSON object without any additional commentary.\n\n"
+            f"Generate a programming question with detailed structure for:\n"
+            f"- Topic: '{r.topic}'\n"
+            f"- Platform: '{r.platform}'\n"
+            f"{f'- Technology: {r.technology}' if r.technology else ''}\n"
+            f"- Tags: {', '.join(r.tags) if r.tags else 'None'}\n"
+            f"- Prompt idea: '{r.question if r.question else 'None provided'}'\n"
         )
 
     def _make_quiz_from_student_answer_system_prompt(self) -> str:
@@ -542,7 +613,7 @@ Example output:
             logger.error(f"Provider unknonw: {model.provider}")
             return False
         
-        if model.model.lower() not in [m.lower() for m in self.supported_models()]:
+        if model.model.lower() not in _SUPPORTED_MODELS_LOWER:
             logger.error(f"Model unknonw: {model.model}")
             return False
         
@@ -554,8 +625,8 @@ Example output:
         For new models (o4-mini, o3-mini, gpt-4o, gpt-4o-mini), use 'max_completion_tokens'.
         For all others, use 'max_tokens'.
         """
-        new_models = ['o4-mini', 'o3-mini', 'gpt-4o-mini', 'gpt-4o']
-        if any(m in model_name.lower() for m in new_models):
+        model_name = model_name.lower()
+        if any(m in model_name for m in _MAX_COMPLETION_TOKENS_MODELS):
             return 'max_completion_tokens'
         return 'max_tokens'
 
@@ -583,16 +654,13 @@ Example output:
         """
         Returns False for models that only support default temperature (1), e.g. o4-mini, o3-mini, gpt-4o, gpt-4o-mini.
         """
-        no_temp_models = ['o4-mini', 'o3-mini', 'gpt-4o-mini', 'gpt-4o']
-        return not any(m in model_name.lower() for m in no_temp_models)
+        model_name = model_name.lower()
+        return not any(m in model_name for m in _DEFAULT_TEMPERATURE_ONLY_MODELS)
 
     def _count_tokens(self, model: str, content) -> int:
         """Count tokens in text/messages."""
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            encoding = tiktoken.get_encoding("cl100k_base")
-        
+        encoding = _encoding_for_model(model)
+
         if isinstance(content, str):
             return len(encoding.encode(content))
         elif isinstance(content, list) and all(isinstance(m, dict) and 'role' in m and 'content' in m for m in content):
@@ -786,65 +854,12 @@ Example output:
 
     def _build_validation_prompt(self, question: QuestionModel) -> List[Dict]:
         """Build validation prompt for OpenAI API."""
-        validation_prompt = f"""
-        You are a quality assurance expert for programming educational content. Your task is to validate the following question against specific criteria and provide a detailed assessment.
-
-## Question to Validate
-```json
-{question.model_dump()}
-```
-
-## Validation Criteria
-
-### Basic Validation (Boolean Fields)
-For each criterion below, provide a true/false assessment:
-1. Is the question text clear, specific, and not generic? (is_text_clear)
-2. Does the question correspond to the topic and tags? (is_question_correspond)
-3. Is the question challenging and not trivial? (is_question_not_trivial)
-4. Does the question have all three difficulty levels? (do_answer_levels_exist)
-5. Are the answer levels valid (Beginner/Intermediate/Advanced)? (are_answer_levels_valid)
-6. Does each answer level have evaluation criteria? (has_evaluation_criteria)
-7. Are the answer levels different and match their difficulty? (are_answer_levels_different)
-8. Does each answer level contain exactly 3 tests? (do_tests_exist)
-9. Does the question have appropriate tags? (do_tags_exist)
-10. Do all tests have more than 2 options? (do_test_options_exist)
-11. Is the question text original? (is_question_text_different_from_existing_questions)
-12. Are test options properly numbered? (are_test_options_numbered)
-13. Do test answers correspond to valid option numbers? (does_answer_contain_option_number)
-14. Are code blocks properly formatted? (are_code_blocks_marked_if_they_exist)
-15. Do test snippets have questions? (does_snippet_have_question)
-16. Do test snippets have code? (does_snippet_have_code)
-
-### Scoring Criteria (1-10)
-For each aspect below, provide a score from 1 to 10:
-1. Clarity and specificity of the question (clarity_score)
-2. Relevance to topic and tags (relevance_score)
-3. Appropriate difficulty level (difficulty_score)
-4. Structure and organization (structure_score)
-5. Code examples quality (code_quality_score)
-6. Overall quality (quality_score)
-
-### Detailed Feedback
-For each scoring criterion above, provide detailed feedback explaining:
-- What works well
-- What needs improvement
-- Specific suggestions for enhancement
-
-### General Assessment
-- General comments about the question (comments)
-- List of specific recommendations for improvement (recommendations)
-- Pass/Fail status based on quality score (passed = quality_score >= 7)
-
-## Response Format
-Your response should include:
-1. Boolean values for all basic validation criteria
-2. Numerical scores (1-10) for each aspect
-3. Detailed feedback for each aspect
-4. Overall quality score
-5. General comments
-6. List of specific recommendations
-7. Pass/Fail status
-"""
+        # Static instructions first and the question last, so repeated validations share a cacheable prompt prefix
+        validation_prompt = (
+            f"{VALIDATION_INSTRUCTIONS}\n"
+            f"## Question to Validate\n"
+            f"```json\n{question.model_dump_json()}\n```\n"
+        )
         
         system_message = "You are a quality assurance expert for programming educational content. Provide thorough validation of questions based on specific criteria."
         
@@ -1,6 +1,18 @@
+import os
 import re
+from functools import lru_cache
+from typing import Any, Optional
 
-def escape_json_strings(obj):
+
+@lru_cache(maxsize=None)
+def env_api_key(var_name: str) -> Optional[str]:
+    """
+    Return the API key in environment variable var_name, or None if unset or blank.
+    Read once per variable on first use, i.e. after any load_dotenv() has run.
+    """
+    return (os.environ.get(var_name) or "").strip() or None
+
+def escape_json_strings(obj: Any) -> Any:
     """
     Recursively escape all string values in a Python object to be valid JSON strings.
     Useful for cleaning up AI responses before parsing as JSON.
@@ -26,7 +38,7 @@ def escape_json_strings(obj):
         return obj
 
 
-def remove_triple_backticks_from_outer_markdown(text):
+def remove_triple_backticks_from_outer_markdown(text: str) -> str:
     """
     Remove triple backticks (``` and ```json, ```swift, etc.) only if they are used to wrap the ENTIRE response (i.e. markdown block at the outermost level).
     Do NOT remove triple backticks inside JSON string values.
@@ -43,39 +55,33 @@ def remove_triple_backticks_from_outer_markdown(text):
 # cleaned = remove_triple_backticks_from_outer_markdown(raw_ai_response_text)
 
 
-def fix_unterminated_strings_in_json(text):
+def fix_unterminated_strings_in_json(text: str) -> str:
     """
     Fixes unterminated string literals in JSON-like text by adding a closing quote if needed.
     This is a best-effort fix for AI-generated, truncated, or malformed JSON.
     """
-    import re
-    result = []
+    # Only the string state is tracked; the text itself is returned unchanged
     in_string = False
     escape = False
-    for i, c in enumerate(text):
+    for c in text:
         if not in_string:
             if c == '"':
                 in_string = True
-                result.append(c)
-            else:
-                result.append(c)
-        else:
-            result.append(c)
-            if escape:
-                escape = False
-            elif c == '\\':
-                escape = True
-            elif c == '"':
-                in_string = False
+        elif escape:
+            escape = False
+        elif c == '\\':
+            escape = True
+        elif c == '"':
+            in_string = False
     # If we are still in a string at the end, close it
     if in_string:
-        result.append('"')
-    return ''.join(result)
+        return text + '"'
+    return text
 
 # Example usage:
 # fixed = fix_unterminated_strings_in_json(json_str)
 
-def escape_newlines_in_json_strings(text):
+def escape_newlines_in_json_strings(text: str) -> str:
     """
     Escapes real newlines (U+000A) and carriage returns (U+000D) inside JSON string literals with \\n and \\r respectively.
     Only affects content inside double-quoted strings.
@@ -83,6 +89,9 @@ def escape_newlines_in_json_strings(text):
         '{"code": "line1\nline2"}' -> '{"code": "line1\\nline2"}'
         '{"code": "line1\rline2"}' -> '{"code": "line1\\rline2"}'
     """
+    # Nothing to escape: skip the per-character scan
+    if '\n' not in text and '\r' not in text:
+        return text
     result = []
     in_string = False
     escape = False
@@ -112,7 +121,7 @@ def escape_newlines_in_json_strings(text):
 # Example usage:
 # fixed = escape_newlines_in_json_strings(json_str)
 
-def fix_missing_commas_in_json(text):
+def fix_missing_commas_in_json(text: str) -> str:
     """
     Inserts missing commas between JSON values and keys if absent.
     Example:
@@ -130,7 +139,7 @@ def fix_missing_commas_in_json(text):
 # Example usage:
 # fixed = fix_missing_commas_in_json(json_str)
 
-def fix_omitted_elements_in_json(text):
+def fix_omitted_elements_in_json(text: str) -> str:
     """
     Removes omitted elements in JSON like '"key": ,' and trailing commas before }} or ]].
     Example:
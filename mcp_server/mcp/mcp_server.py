@@ -10,23 +10,36 @@ It does **not** fully adhere to the official MCP specification and does not
 include standard MCP server endpoints or resource discovery mechanisms.
 """
 from fastapi import FastAPI, Request, status, HTTPException
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
 from enum import Enum
+import importlib
 import logging
 import os
+import re
 import sys
 import inspect
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Type, Callable
+from typing import Dict, Any, Optional, List, Tuple, Type, Callable, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
 import time
-from pydantic import BaseModel
+import threading
+import asyncio
+from pydantic import BaseModel, Field, ValidationError
+from dotenv import load_dotenv
+import orjson
 from .agents.base_agent import AgentProtocol  
+from .agents.ai_models import AIRequestQuestionModel, AIRequestValidationModel, AIModel
+from .response_cache import CACHE_OPERATIONS, make_cache_key, response_cache
+from .agent_pool import agent_pool
 
 # This file defines the FastAPI app for the MCP server
 app = FastAPI(
     title="MCP Standard Server",
     description="Implements the MCP /mcp/v1/execute endpoint for AI agent interaction.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add agents directory to sys.path to allow dynamic imports
@@ -36,9 +49,67 @@ if str(agents_dir) not in sys.path:
 
 logger = logging.getLogger(__name__)
 
+# Load .env once for the whole process, before any agent reads its API key
+load_dotenv()
+
 # --- Dynamically load all agents at startup ---
 loaded_agents = {}
 
+# Methods an agent class must expose to be registered
+REQUIRED_AGENT_METHODS = ("provider", "supported_models", "generate", "validate", "quiz")
+
+# Operations accepted by /mcp/v1/execute
+ALLOWED_OPERATIONS = ("generate", "quiz", "validate", "user_quiz")
+
+# Request model and temperature per operation; the agent method has the operation's name
+OPERATION_REQUESTS = {
+    "generate": (AIRequestQuestionModel, 0.7),
+    "validate": (AIRequestValidationModel, 0.0),
+    "quiz": (AIRequestQuestionModel, 0.85),
+    "user_quiz": (AIRequestQuestionModel, 0.85),
+}
+
+# Legacy/alternate provider names accepted by /mcp/v1/execute
+PROVIDER_ALIASES = {
+    "gemini": "google",
+    "googleai": "google",
+    "claude": "anthropic",
+}
+
+# Provider error messages that mean the quota or rate limit was hit
+QUOTA_ERROR_RE = re.compile(r"429|quota|rate limit", re.IGNORECASE)
+
+# SDK exceptions raised when a provider rejects the API key
+AUTH_ERROR_NAMES = (
+    ("openai", "AuthenticationError"),
+    ("anthropic", "AuthenticationError"),
+    ("google.api_core.exceptions", "PermissionDenied"),
+    ("google.api_core.exceptions", "Unauthenticated"),
+)
+
+def _load_auth_error_types() -> tuple:
+    """Resolve AUTH_ERROR_NAMES, skipping SDKs that are not installed."""
+    error_types = []
+    for module_name, class_name in AUTH_ERROR_NAMES:
+        try:
+            error_types.append(getattr(importlib.import_module(module_name), class_name))
+        except (ImportError, AttributeError):
+            continue
+    return tuple(error_types)
+
+AUTH_ERROR_TYPES = _load_auth_error_types()
+
+def _is_auth_error(exc: BaseException) -> bool:
+    """True if exc, or an exception it was raised from, is an SDK authentication error."""
+    # Agents wrap SDK errors (e.g. RuntimeError(f"OpenAI API error: {e}")), so walk the chain
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, AUTH_ERROR_TYPES):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return False
+
 def dynamic_load_agents():
     """
     Dynamically import all *_agent.py files and register agent classes
@@ -53,8 +124,7 @@ def dynamic_load_agents():
             module = __import__(module_name, fromlist=[''])
             for name, obj in inspect.getmembers(module):
                 if inspect.isclass(obj):
-                    required_methods = ["provider", "supported_models", "generate", "validate", "quiz"]
-                    if all(hasattr(obj, m) and callable(getattr(obj, m, None)) for m in required_methods):
+                    if all(hasattr(obj, m) and callable(getattr(obj, m, None)) for m in REQUIRED_AGENT_METHODS):
                         try:
                             provider = obj.provider()
                             if provider is None:
@@ -69,12 +139,140 @@ def dynamic_load_agents():
     
 dynamic_load_agents()
 
+# Provider and model listings only change on restart, so encode them once
+LISTING_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+def _encode_models_listing(provider: str, agent_class) -> bytes:
+    model_list = []
+    try:
+        model_list = list(agent_class.supported_models())
+    except Exception as e:
+        logger.error(f"Error loading models for agent '{provider}': {e}")
+    return orjson.dumps({"success": True, "models": model_list})
+
+PROVIDERS_BODY = orjson.dumps({"success": True, "providers": list(loaded_agents.keys())})
+MODELS_BODIES = {provider: _encode_models_listing(provider, agent_class) for provider, agent_class in loaded_agents.items()}
+
+# Error responses with constant messages are encoded once as well
+INVALID_BODY_ERROR = orjson.dumps({"success": False, "error": "Invalid request body", "error_type": "value_error"})
+MISSING_FIELDS_ERROR = orjson.dumps({"success": False, "error": "Missing required fields in request", "error_type": "value_error"})
+NO_PROVIDERS_ERROR = orjson.dumps({"success": False, "error": "No providers loaded", "error_type": "server_error"})
+
+def _error_response(body: bytes, status_code: int) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+def _encode_execute_result(response: "MCPResponse") -> Tuple[int, bytes]:
+    """Map an agent response to the (status code, JSON body) returned by /mcp/v1/execute."""
+    if response.success:
+        # Serialize straight from the model in pydantic-core, skipping the intermediate dict
+        return 200, response.model_dump_json().encode()
+
+    logger.error(f"[POST] /mcp/v1/execute | Error: {response.error_type} | {response.error}")
+
+    # Визначаємо статус код відповідно до типу помилки
+    status_code = 400  # За замовчуванням
+
+    # Rejected API keys are recognised by SDK exception type in AIResource.execute
+    if response.error_type == "authentication_error":
+        status_code = 401
+    # Якщо в повідомленні про помилку є згадка про перевищення квоти
+    elif QUOTA_ERROR_RE.search(str(response.error)):
+        status_code = 429
+        response.error_type = "quota_exceeded"
+
+    # Додаємо додаткову інформацію для фронтенду
+    content_dict = response.dict()
+    content_dict['status_code'] = status_code
+    return status_code, orjson.dumps(content_dict)
+
+def _execute_result_response(status_code: int, body: bytes, cache_header: str) -> Response:
+    # X-Cache only describes successful bodies; errors are never cached
+    headers = {"X-Cache": cache_header} if status_code == 200 else None
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
+def warm_agent_pool():
+    """
+    Construct the env-keyed agent for each provider so the first user request
+    doesn't pay for client setup and key verification. Bad or missing keys
+    surface in the logs at boot instead of under traffic.
+    """
+    for provider, agent_class in loaded_agents.items():
+        try:
+            agent_pool.get(agent_class)
+            logger.info(f"Warmed agent for provider '{provider}'")
+        except Exception as e:
+            logger.warning(f"Could not warm agent for provider '{provider}': {e}")
+
+@app.on_event("startup")
+def start_agent_warmup():
+    if os.environ.get("MCP_WARM_AGENTS", "1") == "1":
+        threading.Thread(target=warm_agent_pool, name="agent-warmup", daemon=True).start()
+
 # --- API endpoint: /mcp/v1/execute ---
-from fastapi import Body
-from fastapi.responses import JSONResponse
+
+# Cacheable requests currently being executed, keyed by cache key.
+# Only touched from the event loop, so no lock is needed.
+_in_flight: Dict[str, asyncio.Future] = {}  # result: (status code, body) or None
+
+# Cap on concurrent agent executions per worker; excess requests wait here
+# instead of piling up in the threadpool
+MAX_INFLIGHT = int(os.getenv("MAX_INFLIGHT", 32))
+_execute_slots = asyncio.Semaphore(MAX_INFLIGHT)
+
+@lru_cache(maxsize=64)
+def _canonical_provider(provider: str) -> str:
+    """Lowercase a provider name and resolve legacy aliases."""
+    provider = provider.lower()
+    return PROVIDER_ALIASES.get(provider, provider)
+
+def _validate_execute_body(body: "ExecuteRequest"):
+    """
+    Resolve and check the execute request before any execution work.
+    Returns (MCPContext, None) for a valid request, or (None, error response).
+    """
+    request_type = body.operation
+    payload = body.context
+    ai = body.ai
+
+    # 'ai' may also carry just the provider name
+    if isinstance(ai, str):
+        provider = ai
+        model = body.model
+        api_key = body.api_key
+    else:
+        provider = ai.provider or ai.ai
+        model = ai.model
+        api_key = ai.api_key
+    if provider:
+        provider = _canonical_provider(provider)
+
+    # Validate operation type
+    if request_type not in ALLOWED_OPERATIONS:
+        return None, ORJSONResponse(
+            status_code=422,
+            content={
+                "success": False,
+                "error": f"Unsupported operation '{request_type}'. Allowed: {', '.join(ALLOWED_OPERATIONS)}",
+                "error_type": "operation_error"
+            }
+        )
+    if not provider or not model or not request_type or payload is None:
+        return None, _error_response(MISSING_FIELDS_ERROR, 422)
+    if provider not in loaded_agents:
+        return None, ORJSONResponse(
+            status_code=422,
+            content={
+                "success": False,
+                "error": f"Provider '{provider}' not found",
+                "error_type": "configuration_error"
+            }
+        )
+
+    config = AIConfig(provider=provider, model=model, api_key=api_key)
+    return MCPContext(request_type=request_type, config=config, payload=payload), None
 
 @app.post("/mcp/v1/execute")
-async def execute_endpoint(body: dict = Body(...)):
+async def execute_endpoint(request: Request):
     """
     Unified endpoint for executing agent actions (generate, validate, quiz).
     Accepts ONLY the new MCP payload format:
@@ -88,92 +286,94 @@ async def execute_endpoint(body: dict = Body(...)):
         }
     }
     """
-    logger.info(f"[POST] /mcp/v1/execute | Incoming body: {body}")
+    # Parse and type-check the body in one pass through pydantic-core
     try:
-        request_type = body.get("operation")
-        payload = body.get("context")
-        ai = body.get("ai", {})
-        
-        # Перевірка на випадок, якщо 'ai' використовується як назва провайдера
-        if isinstance(ai, str):
-            provider = ai
-            model = body.get("model")
-            api_key = body.get("api_key")
-        else:
-            provider = ai.get("provider")
-            model = ai.get("model")
-            api_key = ai.get("api_key")
-            
-        # Якщо provider відсутній, але є ai як об'єкт, використовуємо ai як provider
-        if not provider and isinstance(ai, dict) and "ai" in ai:
-            provider = ai.get("ai")
-
-        # Validate operation type
-        allowed_operations = {"generate", "quiz", "validate", "user_quiz"}
-        if request_type not in allowed_operations:
-            return JSONResponse(
-                status_code=422,
-                content={
-                    "success": False,
-                    "error": f"Unsupported operation '{request_type}'. Allowed: {', '.join(allowed_operations)}",
-                    "error_type": "operation_error"
-                }
-            )
-        if not provider or not model or not request_type or payload is None:
-            return JSONResponse(
-                status_code=422,
-                content={
-                    "success": False,
-                    "error": "Missing required fields in request",
-                    "error_type": "value_error"
-                }
-            )
-        if provider not in loaded_agents:
-            return JSONResponse(
-                status_code=422,
-                content={
-                    "success": False,
-                    "error": f"Provider '{provider}' not found",
-                    "error_type": "configuration_error"
-                }
-            )
-        # Prepare config and context for the requested operation
-        agent_class = loaded_agents[provider]
-        config = AIConfig(provider=provider, model=model, api_key=api_key)
-        context = MCPContext(request_type=request_type, config=config, payload=payload)
-        resource = AIResource()
-        response = resource.execute(agent_class, context)
-
-        logger.info(f"[POST] /mcp/v1/execute | Response: {response}")
-        if response.success:
-            return JSONResponse(status_code=200, content=response.dict())
-        else:
-            logger.error(f"[POST] /mcp/v1/execute | Error: {response.error_type} | {response.error}")
-            
-            # Визначаємо статус код відповідно до типу помилки
-            status_code = 400  # За замовчуванням
-            
-            # Якщо в повідомленні про помилку є згадка про перевищення квоти
-            if "429" in str(response.error) or "quota" in str(response.error).lower() or "rate limit" in str(response.error).lower():
-                status_code = 429
-                response.error_type = "quota_exceeded"
-            
-            # Додаємо додаткову інформацію для фронтенду
-            content_dict = response.dict()
-            content_dict['status_code'] = status_code
-            
-            return JSONResponse(status_code=status_code, content=content_dict)
+        body = ExecuteRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        logger.error(f"[POST] /mcp/v1/execute | Invalid request body: {e}")
+        return _error_response(INVALID_BODY_ERROR, 422)
+
+    context, error_response = _validate_execute_body(body)
+    if error_response is not None:
+        return error_response
+    request_type = context.request_type
+    payload = context.payload
+    provider, model, api_key = context.config.provider, context.config.model, context.config.api_key
+
+    try:
+        # Log only once the request is known to be valid, and never the API key
+        logger.info(f"[POST] /mcp/v1/execute | Incoming {request_type} request for {provider}/{model}")
+        logger.debug("[POST] /mcp/v1/execute | Context: %s", payload)
+
+        # Serve repeated requests for cacheable operations from memory (?no_cache=1 bypasses)
+        cache_key = None
+        if request_type in CACHE_OPERATIONS and request.query_params.get("no_cache") != "1":
+            cache_key = make_cache_key(request_type, provider, model, payload, api_key)
+            cached_body = response_cache.get(cache_key)
+            if cached_body is not None:
+                logger.info(f"[POST] /mcp/v1/execute | Cache hit for {request_type} ({provider}/{model})")
+                return Response(content=cached_body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+            # Singleflight: wait for an identical request already in progress instead of calling the provider again.
+            # Waiters get the leader's outcome, errors included: re-running a request that just failed would
+            # send the whole burst to a provider that is already erroring or rate limiting us.
+            in_flight = _in_flight.get(cache_key)
+            if in_flight is not None:
+                shared = await asyncio.shield(in_flight)
+                if shared is not None:
+                    logger.info(f"[POST] /mcp/v1/execute | Coalesced {request_type} ({provider}/{model}) with in-flight request")
+                    return _execute_result_response(*shared, cache_header="HIT")
+                # The in-flight request crashed without a result; fall through and try ourselves
+            else:
+                in_flight = asyncio.get_running_loop().create_future()
+                _in_flight[cache_key] = in_flight
+
+        result = None
+        try:
+            agent_class = loaded_agents[provider]
+            resource = AIResource()
+            # Agent SDK calls block for seconds; run them off the event loop so other requests keep flowing
+            async with _execute_slots:
+                response = await run_in_threadpool(resource.execute, agent_class, context)
+
+            logger.debug("[POST] /mcp/v1/execute | Response: %s", response)
+            result = _encode_execute_result(response)
+            if result[0] == 200 and cache_key is not None:
+                response_cache.set(cache_key, result[1])
+        finally:
+            # Release requests waiting on us (None, if we crashed, tells them to run on their own)
+            if cache_key is not None and _in_flight.get(cache_key) is in_flight:
+                del _in_flight[cache_key]
+                in_flight.set_result(result)
+
+        return _execute_result_response(*result, cache_header="MISS")
     except Exception as e:
-        logger.exception(f"[POST] /mcp/v1/execute | Server error: {e}")
-        return JSONResponse(
+        error_message = str(e)
+        logger.exception(f"[POST] /mcp/v1/execute | Server error: {error_message}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
-                "error": str(e),
+                "error": error_message,
                 "error_type": "server_error"
             }
         )
 
+class AISelection(BaseModel):
+    """Provider/model selection in the 'ai' field of an execute request"""
+    provider: Optional[str] = None
+    model: Optional[str] = None
+    api_key: Optional[str] = None
+    ai: Optional[str] = None # Legacy alias for provider
+
+class ExecuteRequest(BaseModel):
+    """Body of /mcp/v1/execute"""
+    operation: Optional[str] = None
+    context: Optional[Dict[str, Any]] = None
+    ai: Union[str, AISelection] = Field(default_factory=AISelection)
+    model: Optional[str] = None   # Used when 'ai' is a provider name
+    api_key: Optional[str] = None # Used when 'ai' is a provider name
+
 class MCPResponse(BaseModel):
     """Standard MCP response format"""
     success: bool
@@ -183,14 +383,14 @@ class MCPResponse(BaseModel):
 
 # --- AIResource and Context --- #
 
-@dataclass
+@dataclass(slots=True)
 class AIConfig:
     """Configuration for the AI request."""
     provider: str # e.g., 'openai', 'google', 'anthropic'
     model: str    # Specific model identifier, e.g., 'gpt-4o'
     api_key: Optional[str] = None # API key, if provided directly
 
-@dataclass
+@dataclass(slots=True)
 class MCPContext:
     """Context object passed to agent methods."""
     request_type: str # 'generate' or 'validate'
@@ -199,6 +399,18 @@ class MCPContext:
     statistics: Dict[str, Any] = field(default_factory=dict) # Use default_factory for mutable default
 
 
+@lru_cache(maxsize=256)
+def _agent_config_error(agent_class: Type[AgentProtocol], provider: str, model: str) -> Optional[str]:
+    """Return why provider/model don't match agent_class, or None if they do. Memoized per combination."""
+    # Compare with agent_class.provider() instead of class name for correct aliasing
+    provider_name_from_class = agent_class.provider()
+    if provider != provider_name_from_class:
+        return f"Mismatch: Agent class {agent_class.__name__} (provider={provider_name_from_class}) does not match provider '{provider}'"
+    supported_models = agent_class.supported_models()
+    if model not in supported_models:
+        return f"Model '{model}' is not supported by {agent_class.__name__}. Supported: {supported_models}"
+    return None
+
 class AIResource:
     """Handles executing requests using the appropriate AI agent based on context."""
 
@@ -208,52 +420,30 @@ class AIResource:
 
         try:
             # Validate provider and model compatibility with the agent
-            # Compare with agent_class.provider() instead of class name for correct aliasing
-            provider_name_from_class = agent_class.provider()
-            if context.config.provider != provider_name_from_class:
-                return MCPResponse(success=False, error=f"Mismatch: Agent class {agent_class.__name__} (provider={provider_name_from_class}) does not match provider '{context.config.provider}'", error_type="configuration_error")
+            config_error = _agent_config_error(agent_class, context.config.provider, context.config.model)
+            if config_error is not None:
+                return MCPResponse(success=False, error=config_error, error_type="configuration_error")
 
-            # Use supported_models() instead of get_supported_models()
-            if context.config.model not in agent_class.supported_models():
-                return MCPResponse(success=False, error=f"Model '{context.config.model}' is not supported by {agent_class.__name__}. Supported: {agent_class.supported_models()}", error_type="configuration_error")
-
-            # Instantiate the agent with the API key from the config
-            agent_instance = agent_class(api_key=context.config.api_key)
+            if context.request_type not in ALLOWED_OPERATIONS:
+                return MCPResponse(success=False, error=f"Unsupported request type: {context.request_type}", error_type="value_error")
 
-            # Execute the appropriate method
-            from mcp.agents.ai_models import AIRequestQuestionModel, AIRequestValidationModel, AIModel
+            # Build the typed request first so invalid payloads fail before any agent/SDK work
             # Auto-convert legacy dict payload to AIRequestQuestionModel/AIRequestValidationModel if needed
-            if context.request_type == 'generate':
-                if isinstance(context.payload, dict):
-                    model = AIModel(provider=context.config.provider, model=context.config.model)
-                    payload_obj = AIRequestQuestionModel(model=model, request=context.payload, temperature=0.7)
-                    result_data = agent_instance.generate(payload_obj)
-                else:
-                    result_data = agent_instance.generate(context.payload)
-            elif context.request_type == 'validate':
-                if isinstance(context.payload, dict):
-                    model = AIModel(provider=context.config.provider, model=context.config.model)
-                    payload_obj = AIRequestValidationModel(model=model, request=context.payload, temperature=0.0)
-                    result_data = agent_instance.validate(payload_obj)
-                else:
-                    result_data = agent_instance.validate(context.payload)
-            elif context.request_type == 'quiz':
-                if isinstance(context.payload, dict):
-                    model = AIModel(provider=context.config.provider, model=context.config.model)
-                    payload_obj = AIRequestQuestionModel(model=model, request=context.payload, temperature=0.85)
-                    result_data = agent_instance.quiz(payload_obj)
-                else:
-                    result_data = agent_instance.quiz(context.payload)
-            elif context.request_type == 'user_quiz':
-                if isinstance(context.payload, dict):
-                    model = AIModel(provider=context.config.provider, model=context.config.model)
-                    payload_obj = AIRequestQuestionModel(model=model, request=context.payload, temperature=0.85)
-                    result_data = agent_instance.user_quiz(payload_obj)
-                else:
-                    result_data = agent_instance.user_quiz(context.payload)
-
-            else:
-                return MCPResponse(success=False, error=f"Unsupported request type: {context.request_type}", error_type="value_error")
+            payload_obj = context.payload
+            if isinstance(context.payload, dict):
+                request_model, temperature = OPERATION_REQUESTS[context.request_type]
+                model = AIModel(provider=context.config.provider, model=context.config.model)
+                try:
+                    payload_obj = request_model(model=model, request=context.payload, temperature=temperature)
+                except ValidationError as ve:
+                    logger.error(f"Invalid {context.request_type} payload: {ve}")
+                    return MCPResponse(success=False, error=f"Invalid {context.request_type} payload: {ve}", error_type="value_error")
+
+            # Reuse a pooled agent (and its SDK client) for this provider/API key
+            agent_instance = agent_pool.get(agent_class, context.config.api_key)
+
+            # Execute the agent method named after the operation
+            result_data = getattr(agent_instance, context.request_type)(payload_obj)
 
             # Calculate duration and potentially add other stats from result_data if agent provides them
             duration_ms = (time.time() - start_time) * 1000
@@ -277,54 +467,46 @@ class AIResource:
             logger.error(f"{agent_class.__name__} does not implement '{context.request_type}'")
             return MCPResponse(success=False, error=f"Functionality '{context.request_type}' not implemented by provider '{context.config.provider}'", error_type="not_implemented")
         except ValueError as ve:
-            logger.error(f"ValueError during agent execution: {ve}")
+            error_message = str(ve)
+            logger.error(f"ValueError during agent execution: {error_message}")
             # Could be API key issue or other validation within agent
-            return MCPResponse(success=False, error=str(ve), error_type="agent_execution_error") # Or more specific error type?
+            return MCPResponse(success=False, error=error_message, error_type="agent_execution_error") # Or more specific error type?
         except Exception as e:
-            logger.exception(f"Unexpected error executing {context.request_type} with {agent_class.__name__}: {e}")
+            error_message = str(e)
+            logger.exception(f"Unexpected error executing {context.request_type} with {agent_class.__name__}: {error_message}")
+            if _is_auth_error(e):
+                return MCPResponse(success=False, error=error_message, error_type="authentication_error")
             # Catch potential API errors (e.g., connection, authentication) here if possible
             # error_type = "api_error" or "agent_execution_error"
-            return MCPResponse(success=False, error=f"An unexpected error occurred: {e}", error_type="server_error")
+            return MCPResponse(success=False, error=f"An unexpected error occurred: {error_message}", error_type="server_error")
 
 @app.get("/mcp/v1/providers")
 async def get_providers():
     """Return the list of loaded agent resource_ids."""
     if len(loaded_agents) == 0:
-        return {
-            "success": False,
-            "error": "No providers loaded",
-            "error_type": "server_error"
-        }
+        return _error_response(NO_PROVIDERS_ERROR, 503)
 
-    return {
-        "success": True,
-        "providers": list(loaded_agents.keys())
-    }
+    return Response(content=PROVIDERS_BODY, media_type="application/json", headers=LISTING_HEADERS)
 
 @app.get("/mcp/v1/models/{provider}")
 async def get_models_for_provider(provider: str):
     """Return models only for the specified provider."""
     if len(loaded_agents) == 0:
-        return {
-            "success": False,
-            "error": "No providers loaded",
-            "error_type": "server_error"
-        }
+        return _error_response(NO_PROVIDERS_ERROR, 503)
 
-    model_list = []
-    for resource_id, agent_class in loaded_agents.items():
-        try:
-            provider_id = agent_class.provider() if hasattr(agent_class, "provider") else resource_id
-            if provider_id == provider:
-                models = agent_class.supported_models() if hasattr(agent_class, "supported_models") else []
-                for model in models:
-                    model_list.append(model)
-        except Exception as e:
-            logger.error(f"Error loading models for agent '{resource_id}': {e}")
-    return {
-        "success": True,
-        "models": model_list
-    }
+    # MODELS_BODIES is keyed by agent_class.provider(), so a direct lookup replaces the scan
+    models_body = MODELS_BODIES.get(provider)
+    if models_body is None:
+        return ORJSONResponse(
+            status_code=404,
+            content={
+                "success": False,
+                "error": f"Provider '{provider}' not found",
+                "error_type": "configuration_error"
+            }
+        )
+
+    return Response(content=models_body, media_type="application/json", headers=LISTING_HEADERS)
 
 @app.get("/mcp/v1/model-description/{provider}/{model}")
 async def get_model_description(provider: str, model: str):
@@ -0,0 +1,84 @@
+"""
+In-process response cache for /mcp/v1/execute.
+
+Identical requests for a cacheable operation (same operation, provider, model,
+context and API key) are answered from memory instead of calling the AI
+provider again. Entries expire after a TTL and the least recently used entries
+are evicted once the cache is full.
+
+Configuration (environment variables):
+    MCP_CACHE_OPERATIONS  Comma-separated operations to cache (default: "validate").
+                          Empty disables the cache.
+    MCP_CACHE_TTL         Entry lifetime in seconds (default: 3600).
+    MCP_CACHE_SIZE        Maximum number of entries (default: 256).
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import orjson
+
+CACHE_OPERATIONS = frozenset(
+    op.strip() for op in os.getenv("MCP_CACHE_OPERATIONS", "validate").split(",") if op.strip()
+)
+CACHE_TTL = float(os.getenv("MCP_CACHE_TTL", 3600))
+CACHE_SIZE = int(os.getenv("MCP_CACHE_SIZE", 256))
+
+
+def _canonical_tags(tags: Any) -> Any:
+    """Dedupe and sort tags so reordered or repeated tag lists share a key."""
+    if not isinstance(tags, list):
+        return tags
+    return sorted({str(tag).strip() for tag in tags if str(tag).strip()})
+
+
+def make_cache_key(operation: str, provider: str, model: str, context: Dict[str, Any], api_key: Optional[str]) -> str:
+    """Build a stable key for a request. The API key is hashed, never stored."""
+    key_digest = hashlib.sha256(api_key.encode()).hexdigest() if api_key else ""
+    if isinstance(context, dict) and "tags" in context:
+        context = {**context, "tags": _canonical_tags(context["tags"])}
+    raw = orjson.dumps([operation, provider, model, context, key_digest], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of encoded response bodies."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE, ttl: float = CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store body under key, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,54 @@
+import unittest
+
+from mcp.agent_pool import AgentPool
+
+
+class CountingAgent:
+    instances = 0
+
+    def __init__(self, api_key=None):
+        type(self).instances += 1
+        self.api_key = api_key
+
+
+class OtherAgent(CountingAgent):
+    pass
+
+
+class AgentPoolTest(unittest.TestCase):
+    def setUp(self):
+        CountingAgent.instances = 0
+
+    def test_reuses_agent_for_same_class_and_key(self):
+        pool = AgentPool(maxsize=4)
+        self.assertIs(pool.get(CountingAgent, "key-a"), pool.get(CountingAgent, "key-a"))
+        self.assertEqual(CountingAgent.instances, 1)
+
+    def test_separates_keys_and_classes(self):
+        pool = AgentPool(maxsize=4)
+        agent = pool.get(CountingAgent, "key-a")
+        self.assertIsNot(agent, pool.get(CountingAgent, "key-b"))
+        self.assertIsNot(agent, pool.get(CountingAgent, None))
+        self.assertIsNot(agent, pool.get(OtherAgent, "key-a"))
+
+    def test_evicts_least_recently_used_beyond_cap(self):
+        pool = AgentPool(maxsize=2)
+        agent_a = pool.get(CountingAgent, "key-a")
+        pool.get(CountingAgent, "key-b")
+        # Touch "key-a" so "key-b" becomes the eviction candidate
+        pool.get(CountingAgent, "key-a")
+        pool.get(CountingAgent, "key-c")
+
+        self.assertEqual(len(pool._agents), 2)
+        self.assertIs(pool.get(CountingAgent, "key-a"), agent_a)
+        instances = CountingAgent.instances
+        pool.get(CountingAgent, "key-b")
+        self.assertEqual(CountingAgent.instances, instances + 1)
+
+    def test_zero_size_does_not_pool(self):
+        pool = AgentPool(maxsize=0)
+        self.assertIsNot(pool.get(CountingAgent, "key-a"), pool.get(CountingAgent, "key-a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
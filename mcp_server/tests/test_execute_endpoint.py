@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+from fastapi.testclient import TestClient
+from google.api_core import exceptions as google_exceptions
+
+from mcp import mcp_server
+from mcp.agent_pool import agent_pool
+from mcp.response_cache import response_cache
+
+
+class FakeAgent:
+    """Minimal agent whose generate() behaviour is set per test."""
+
+    generate_side_effect = None
+
+    def __init__(self, api_key=None):
+        self.api_key = api_key
+
+    @staticmethod
+    def provider():
+        return "fake"
+
+    @staticmethod
+    def supported_models():
+        return ["fake-model"]
+
+    def generate(self, request):
+        return type(self).generate_side_effect(request)
+
+    def validate(self, request):
+        raise NotImplementedError
+
+    def quiz(self, request):
+        raise NotImplementedError
+
+
+def _execute_body(api_key="test-key"):
+    return {
+        "operation": "generate",
+        "context": {"topic": "Concurrency", "platform": "iOS"},
+        "ai": {"provider": "fake", "model": "fake-model", "api_key": api_key},
+    }
+
+
+class ExecuteEndpointTestCase(unittest.TestCase):
+    def setUp(self):
+        mock.patch.dict(mcp_server.loaded_agents, {"fake": FakeAgent}).start()
+        self.addCleanup(mock.patch.stopall)
+        self.addCleanup(agent_pool.clear)
+        self.addCleanup(response_cache.clear)
+        self.client = TestClient(mcp_server.app)
+
+    def _fail_with(self, exc):
+        def generate(request):
+            try:
+                raise exc
+            except Exception as e:
+                # Agents wrap SDK errors the same way
+                raise RuntimeError(f"Fake API error: {e}")
+        FakeAgent.generate_side_effect = staticmethod(generate)
+
+
+class AuthErrorClassificationTest(ExecuteEndpointTestCase):
+    def test_sdk_authentication_error_returns_401(self):
+        self._fail_with(google_exceptions.Unauthenticated("API key not valid"))
+
+        response = self.client.post("/mcp/v1/execute", json=_execute_body())
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["error_type"], "authentication_error")
+
+    def test_key_related_message_without_auth_exception_is_not_401(self):
+        self._fail_with(RuntimeError("No API_KEY or ADC found"))
+
+        response = self.client.post("/mcp/v1/execute", json=_execute_body())
+
+        self.assertNotEqual(response.status_code, 401)
+        self.assertNotEqual(response.json()["error_type"], "authentication_error")
+
+
+class SingleflightTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        mock.patch.dict(mcp_server.loaded_agents, {"fake": FakeAgent}).start()
+        self.addCleanup(mock.patch.stopall)
+        self.addCleanup(response_cache.clear)
+        self.calls = 0
+
+    async def _post_concurrently(self, response, count=3):
+        release = asyncio.Event()
+
+        async def fake_run_in_threadpool(func, *args):
+            self.calls += 1
+            await release.wait()
+            return response
+
+        mock.patch.object(mcp_server, "run_in_threadpool", fake_run_in_threadpool).start()
+        body = {**_execute_body(), "operation": "validate"}
+        transport = httpx.ASGITransport(app=mcp_server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            tasks = [asyncio.create_task(client.post("/mcp/v1/execute", json=body)) for _ in range(count)]
+            # Let every request reach the provider call or the in-flight wait before the leader finishes
+            while not self.calls:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+    async def test_identical_requests_share_one_upstream_call(self):
+        result = mcp_server.MCPResponse(success=True, data={"is_valid": True})
+
+        responses = await self._post_concurrently(result)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual({r.content for r in responses}, {result.model_dump_json().encode()})
+        self.assertEqual(sorted(r.headers["X-Cache"] for r in responses), ["HIT", "HIT", "MISS"])
+
+    async def test_waiters_get_the_leaders_error_without_retrying(self):
+        result = mcp_server.MCPResponse(success=False, error="429 quota exceeded", error_type="server_error")
+
+        responses = await self._post_concurrently(result)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual([r.status_code for r in responses], [429, 429, 429])
+        self.assertEqual(len({r.content for r in responses}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
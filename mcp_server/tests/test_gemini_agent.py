@@ -0,0 +1,87 @@
+import threading
+import unittest
+from unittest import mock
+
+import google.ai.generativelanguage as glm
+
+from mcp.agents import gemini_agent
+from mcp.agents.gemini_agent import GeminiAgent
+
+
+class FakeGenerativeClient:
+    """Stands in for glm.GenerativeServiceClient; answers with the key it was built for."""
+
+    def __init__(self, api_key, barrier=None):
+        self.api_key = api_key
+        self.barrier = barrier
+
+    def generate_content(self, request, **kwargs):
+        if self.barrier is not None:
+            # Only passes once every agent has a call in flight at the same time
+            self.barrier.wait()
+        part = glm.Part(text=self.api_key)
+        candidate = glm.Candidate(content=glm.Content(parts=[part], role="model"), finish_reason=1)
+        return glm.GenerateContentResponse(candidates=[candidate])
+
+
+def _agent_with_fake_client(api_key, barrier=None):
+    agent = GeminiAgent(api_key=api_key)
+    agent._client = FakeGenerativeClient(api_key, barrier)
+    return agent
+
+
+class GeminiAgentClientTest(unittest.TestCase):
+    def _call(self, agent):
+        return agent._generate_content("gemini-2.0-flash", ["prompt"], {"temperature": 0.0})
+
+    def test_agents_with_different_keys_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        agents = [_agent_with_fake_client("key-a", barrier), _agent_with_fake_client("key-b", barrier)]
+        results, errors = {}, []
+
+        def run(agent):
+            try:
+                results[agent.api_key] = self._call(agent).text
+            except Exception as e:  # BrokenBarrierError if the calls were serialized
+                errors.append(e)
+
+        with mock.patch.object(gemini_agent.genai, "configure") as configure:
+            threads = [threading.Thread(target=run, args=(agent,)) for agent in agents]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, {"key-a": "key-a", "key-b": "key-b"})
+        # The process-global key is never touched
+        configure.assert_not_called()
+
+    def test_repeated_concurrent_calls_keep_their_own_key(self):
+        agents = [_agent_with_fake_client("key-a"), _agent_with_fake_client("key-b")]
+        mismatches = []
+
+        def run(agent):
+            for _ in range(50):
+                text = self._call(agent).text
+                if text != agent.api_key:
+                    mismatches.append((agent.api_key, text))
+
+        threads = [threading.Thread(target=run, args=(agent,)) for agent in agents]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mismatches, [])
+
+    def test_agent_without_key_does_not_use_default_client(self):
+        with mock.patch.object(gemini_agent, "env_api_key", return_value=None):
+            agent = GeminiAgent()
+
+        with self.assertRaises(ValueError):
+            self._call(agent)
+
+
+if __name__ == "__main__":
+    unittest.main()
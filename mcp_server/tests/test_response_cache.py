@@ -0,0 +1,99 @@
+import hashlib
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+from mcp import response_cache as response_cache_module
+from mcp.response_cache import ResponseCache, make_cache_key
+
+
+def _key(context, api_key="test-key"):
+    return make_cache_key("validate", "openai", "gpt-4o", context, api_key)
+
+
+def _load_fresh_module():
+    """Import a private copy of response_cache so its env-derived settings are re-read."""
+    spec = importlib.util.spec_from_file_location("response_cache_copy", response_cache_module.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class MakeCacheKeyTest(unittest.TestCase):
+    def test_reordered_and_repeated_tags_share_a_key(self):
+        self.assertEqual(
+            _key({"question": "q", "tags": ["Swift", " UI ", "Swift"]}),
+            _key({"question": "q", "tags": ["UI", "Swift"]}),
+        )
+
+    def test_tag_case_is_significant(self):
+        self.assertNotEqual(
+            _key({"question": "q", "tags": ["Swift"]}),
+            _key({"question": "q", "tags": ["swift"]}),
+        )
+
+    def test_api_key_separates_tenants(self):
+        context = {"question": "q"}
+        self.assertNotEqual(_key(context, "key-a"), _key(context, "key-b"))
+        self.assertNotEqual(_key(context, "key-a"), _key(context, None))
+        self.assertEqual(_key(context, "key-a"), _key(context, "key-a"))
+
+    def test_key_uses_api_key_digest_not_raw_key(self):
+        context = {"question": "q"}
+        digest = hashlib.sha256(b"key-a").hexdigest()
+        with mock.patch.object(response_cache_module.orjson, "dumps", wraps=response_cache_module.orjson.dumps) as dumps:
+            _key(context, "key-a")
+        hashed_fields = dumps.call_args.args[0]
+        self.assertIn(digest, hashed_fields)
+        self.assertNotIn("key-a", hashed_fields)
+
+    def test_only_validate_is_cached_by_default(self):
+        env = {k: v for k, v in os.environ.items() if k != "MCP_CACHE_OPERATIONS"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            module = _load_fresh_module()
+        self.assertEqual(module.CACHE_OPERATIONS, frozenset({"validate"}))
+
+    def test_empty_cache_operations_disables_cache(self):
+        with mock.patch.dict(os.environ, {"MCP_CACHE_OPERATIONS": ""}):
+            module = _load_fresh_module()
+        self.assertEqual(module.CACHE_OPERATIONS, frozenset())
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(response_cache_module.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entry_expires_after_ttl(self):
+        cache = ResponseCache(maxsize=4, ttl=60)
+        cache.set("a", b"body")
+
+        self.now += 59
+        self.assertEqual(cache.get("a"), b"body")
+
+        self.now += 2
+        self.assertIsNone(cache.get("a"))
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        # Reading "a" makes "b" the least recently used entry
+        cache.get("a")
+        cache.set("c", b"3")
+
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), b"3")
+
+    def test_zero_size_stores_nothing(self):
+        cache = ResponseCache(maxsize=0, ttl=60)
+        cache.set("a", b"1")
+        self.assertIsNone(cache.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
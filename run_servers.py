@@ -14,16 +14,17 @@ logger = logging.getLogger(__name__)
 MCP_SERVER_PORT = 10001
 APPLICATION_PORT = 10000
 
+def _pids_on_port(port):
+    """Return the PIDs listening on the given port (macOS/Linux lsof)."""
+    result = subprocess.run(["lsof", "-ti", f":{port}"], capture_output=True, text=True)
+    return [pid for pid in result.stdout.strip().split("\n") if pid]
+
 def kill_process_on_port(port):
     """Kill any process using the given port (macOS)."""
-    import subprocess
     try:
-        result = subprocess.run(["lsof", "-ti", f":{port}"], capture_output=True, text=True)
-        pids = result.stdout.strip().split("\n")
-        for pid in pids:
-            if pid:
-                logger.info(f"Killing process {pid} on port {port}...")
-                subprocess.run(["kill", "-9", pid])
+        for pid in _pids_on_port(port):
+            logger.info(f"Killing process {pid} on port {port}...")
+            subprocess.run(["kill", "-9", pid])
     except Exception as e:
         logger.warning(f"Failed to kill process on port {port}: {e}")
 
@@ -35,85 +36,63 @@ def check_ports():
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
             sock.bind(('localhost', port))
-            sock.close()
         except socket.error:
-            logger.error(f"Port {port} is already in use. Please free the port and try again.")
+            logger.error(f"Port {port} is still in use after attempting to kill. PIDs: {_pids_on_port(port)}")
             return False
+        finally:
+            sock.close()
     return True
 
-def run_mcp_server():
-    """Run MCP server."""
-    logger.info("Starting MCP server...")
-    
+def _start_server(name, script, extra_env):
+    """Start a server script as a subprocess and check that it is still alive after startup."""
+    logger.info(f"Starting {name}...")
+
     # Get the absolute path to the project root
     project_root = Path(__file__).parent.absolute()
     logger.info(f"Project root: {project_root}")
-    
+
     # Set up environment variables
     env = os.environ.copy()
     env['PYTHONPATH'] = f"{project_root}:{env.get('PYTHONPATH', '')}"
-    env['MCP_PORT'] = str(MCP_SERVER_PORT)
-    env['MCP_HOST'] = "0.0.0.0"
-    logger.info(f"Environment variables set: PYTHONPATH={env['PYTHONPATH']}, MCP_PORT={env['MCP_PORT']}")
-    
+    env.update(extra_env)
+    logger.info(f"Environment variables set: PYTHONPATH={env['PYTHONPATH']}, " + ", ".join(f"{k}={v}" for k, v in extra_env.items()))
+
     # Start the server
-    logger.info("Starting MCP server process...")
-    mcp_process = subprocess.Popen(
-        [sys.executable, "mcp_server/mcp_main.py"],
+    logger.info(f"Starting {name} process...")
+    process = subprocess.Popen(
+        [sys.executable, script],
         env=env,
         cwd=str(project_root),
-        stdout=sys.stdout,  # Перенаправляємо stdout в stdout основного процесу
-        stderr=sys.stderr   # Перенаправляємо stderr в stderr основного процесу
+        stdout=sys.stdout,  # Forward stdout to the parent process
+        stderr=sys.stderr   # Forward stderr to the parent process
     )
-    logger.info(f"MCP server process started with PID: {mcp_process.pid}")
-    
-    # Даємо серверу час на запуск
+    logger.info(f"{name} process started with PID: {process.pid}")
+
+    # Give the server time to start
     time.sleep(2)
-    
-    # Перевіряємо, чи процес все ще запущений
-    if mcp_process.poll() is not None:
-        logger.error(f"MCP server failed to start. Exit code: {mcp_process.returncode}")
+
+    # Check that the process is still running
+    if process.poll() is not None:
+        logger.error(f"{name} failed to start. Exit code: {process.returncode}")
         return None
-    
-    logger.info("MCP server startup check completed")
-    return mcp_process
+
+    logger.info(f"{name} startup check completed")
+    return process
+
+def run_mcp_server():
+    """Run MCP server."""
+    return _start_server("MCP server", "mcp_server/mcp_main.py", {
+        'MCP_PORT': str(MCP_SERVER_PORT),
+        'MCP_HOST': "0.0.0.0",
+    })
 
 def run_application():
     """Run application server."""
-    logger.info("Starting application server...")
-    
-    # Get the absolute path to the project root
-    project_root = Path(__file__).parent.absolute()
-    logger.info(f"Project root: {project_root}")
-    
-    # Set up environment variables
-    env = os.environ.copy()
-    env['PYTHONPATH'] = f"{project_root}:{env.get('PYTHONPATH', '')}"
-    env['PORT'] = str(APPLICATION_PORT)
-    env['MCP_SERVER_URL'] = f"http://localhost:{MCP_SERVER_PORT}"
-    logger.info(f"Environment variables set: PYTHONPATH={env['PYTHONPATH']}, PORT={env['PORT']}")
-    
-    # Start the server
-    logger.info("Starting application server process...")
-    app_process = subprocess.Popen(
-        [sys.executable, "application/app.py"],
-        env=env,
-        cwd=str(project_root),
-        stdout=sys.stdout,  # Перенаправляємо stdout в stdout основного процесу
-        stderr=sys.stderr   # Перенаправляємо stderr в stderr основного процесу
-    )
-    logger.info(f"Application server process started with PID: {app_process.pid}")
-    
-    # Даємо серверу час на запуск
-    time.sleep(2)
-    
-    # Перевіряємо, чи процес все ще запущений
-    if app_process.poll() is not None:
-        logger.error(f"Application server failed to start. Exit code: {app_process.returncode}")
-        return None
-    
-    logger.info("Application server startup check completed")
-    return app_process
+    return _start_server("Application server", "application/app.py", {
+        'PORT': str(APPLICATION_PORT),
+        'MCP_SERVER_URL': f"http://localhost:{MCP_SERVER_PORT}",
+        'FLASK_DEBUG': "1",  # Local development: keep the Flask reloader and debugger
+    })
 
 def main():
     """
@@ -122,49 +101,24 @@ def main():
     logger.info("Starting server initialization...")
 
     # Ensure all required ports are free before starting servers
-    import socket
-    ports_to_check = [MCP_SERVER_PORT, APPLICATION_PORT]
-    for port in ports_to_check:
-        kill_process_on_port(port)  # Try to kill any process using the port
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            sock.bind(('localhost', port))
-            sock.close()
-        except socket.error:
-            # Port is still busy, print PIDs and exit
-            import subprocess
-            result = subprocess.run(["lsof", "-ti", f":{port}"], capture_output=True, text=True)
-            pids = [pid for pid in result.stdout.strip().split("\n") if pid]
-            logger.error(f"Port {port} is still in use after attempting to kill. PIDs: {pids}")
-            sys.exit(1)
-
-    # Start MCP server
+    if not check_ports():
+        sys.exit(1)
+
+    # Start MCP server (run_mcp_server already waits for startup)
     logger.info("Attempting to start MCP server...")
     mcp_process = run_mcp_server()
-    
-    # Wait for MCP server to start
-    logger.info("Waiting for MCP server to initialize...")
-    time.sleep(2)
-    
-    # Check if MCP server started successfully
     if mcp_process is None:
         logger.error("MCP server failed to start")
         return
-    
+
     # Start application server
     logger.info("Attempting to start application server...")
     app_process = run_application()
-    
-    # Wait for application server to start
-    logger.info("Waiting for application server to initialize...")
-    time.sleep(2)
-    
-    # Check if application server started successfully
     if app_process is None:
         logger.error("Application server failed to start")
         mcp_process.terminate()
         return
-    
+
     logger.info(f"MCP server running on http://localhost:{MCP_SERVER_PORT}")
     logger.info(f"Application running on http://localhost:{APPLICATION_PORT}")
     